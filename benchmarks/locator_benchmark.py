@@ -0,0 +1,64 @@
+"""
+Locator lookup cost, before (old page locators) vs after (pages/locators.py registry).
+
+    python benchmarks/locator_benchmark.py --browser      # find_elements on the local stand-in site
+
+Browser mode logs in on the local site (utils/local_server.py) with 1 item in the cart
+and times every lookup N times in the same page, so only the selector strategy differs.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from selenium.webdriver.common.by import By
+from pages import locators
+
+#(name, page, before, after) - "before" is what the page classes used until the registry
+LOOKUPS = [
+    ("title", "inventory.html", (By.CLASS_NAME, "title"), locators.TITLE),
+    ("cart badge", "inventory.html", (By.CLASS_NAME, "shopping_cart_badge"), locators.SHOPPING_CART_BADGE),
+    ("cart remove button", "cart.html", (By.XPATH, "//button[contains(text(), 'Remove')]"), locators.CART_REMOVE_BUTTON),
+    ("checkout error", "checkout-step-one.html", (By.CSS_SELECTOR, "h3[data-test='error']"), locators.ERROR_MESSAGE),
+]
+
+
+def bench_browser(number):
+    from utils.cart_seeder import seed_cart
+    from utils.config import get_base_url
+    from utils.driver_pool import create_chrome_driver
+
+    os.environ.setdefault("TEST_ENV", "local")
+    base_url = get_base_url()
+    driver = create_chrome_driver()
+    try:
+        #logged in + 1 item in cart, the error box is opened with an empty form
+        driver.get(base_url)
+        driver.add_cookie({"name": "session-username", "value": "standard_user"})
+        seed_cart(driver, ["Sauce Labs Backpack"], page="inventory.html")
+
+        print(f"\nfind_elements x{number} ({base_url})")
+        print(f"  {'lookup':<22} {'before ms':>10} {'after ms':>10}  found")
+        for name, page, before, after in LOOKUPS:
+            driver.get(base_url + page)
+            if page.startswith("checkout"):
+                driver.find_element(*locators.CONTINUE_BUTTON).click()
+            found = (len(driver.find_elements(*before)), len(driver.find_elements(*after)))
+            time_before = timeit.timeit(lambda: driver.find_elements(*before), number=number)
+            time_after = timeit.timeit(lambda: driver.find_elements(*after), number=number)
+            print(f"  {name:<22} {time_before / number * 1000:10.3f} {time_after / number * 1000:10.3f}  {found}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Locator lookup benchmark (before / after registry)")
+    parser.add_argument("--browser", action="store_true", help="time find_elements in Chrome")
+    parser.add_argument("--number", type=int, default=200, help="lookups per locator in browser mode")
+    args = parser.parse_args()
+
+    print(f"{len(locators.get_registry())} locators registered")
+    if args.browser:
+        bench_browser(args.number)
@@ -0,0 +1,420 @@
+/* Local stand-in for https://www.saucedemo.com/
+ * Same ids / classes / texts as the real site for everything used by pages/*.py.
+ * State is kept like the real site: "session-username" cookie + "cart-contents" in localStorage.
+ */
+(function () {
+    "use strict";
+
+    var PRODUCTS = window.SAUCE_PRODUCTS || [];
+    var USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+    var PASSWORD = "secret_sauce";
+    var TAX_RATE = 0.08;
+
+    // ---------- STATE ----------
+    function getCookie(name) {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + name + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSession(username) {
+        document.cookie = "session-username=" + encodeURIComponent(username) + "; path=/; max-age=600";
+    }
+
+    function clearSession() {
+        document.cookie = "session-username=; path=/; max-age=0";
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem("cart-contents")) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function saveCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem("cart-contents", JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem("cart-contents");
+        }
+        renderBadge();
+    }
+
+    function findProduct(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) { return PRODUCTS[i]; }
+        }
+        return null;
+    }
+
+    function cartProducts() {
+        return getCart().map(findProduct).filter(Boolean);
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function slug(name) {
+        // same rule as saucedemo data-test ids: "Sauce Labs Backpack" -> "sauce-labs-backpack"
+        return name.replace(/\s+/g, "-").toLowerCase();
+    }
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === "text") {
+                node.textContent = attrs[key];
+            } else if (key === "onclick") {
+                node.addEventListener("click", attrs[key]);
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+        (children || []).forEach(function (child) { node.appendChild(child); });
+        return node;
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    // ---------- SHARED HEADER ----------
+    function renderHeader(title, extra) {
+        var menu = el("div", { "class": "bm-menu-wrap", "hidden": "hidden" }, [
+            el("nav", { "class": "bm-item-list" }, [
+                el("a", { id: "inventory_sidebar_link", "class": "bm-item menu-item", href: "inventory.html", text: "All Items" }),
+                el("a", { id: "logout_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Logout", onclick: function (e) {
+                    e.preventDefault();
+                    clearSession();
+                    go("./");
+                } }),
+                el("a", { id: "reset_sidebar_link", "class": "bm-item menu-item", href: "#", text: "Reset App State", onclick: function (e) {
+                    e.preventDefault();
+                    saveCart([]);
+                } })
+            ]),
+            el("button", { id: "react-burger-cross-btn", type: "button", text: "Close Menu", onclick: function () {
+                menu.setAttribute("hidden", "hidden");
+            } })
+        ]);
+        var burger = el("div", { id: "menu_button_container" }, [
+            el("button", { id: "react-burger-menu-btn", type: "button", text: "Open Menu", onclick: function () {
+                menu.removeAttribute("hidden");
+            } }),
+            menu
+        ]);
+        var cart = el("div", { id: "shopping_cart_container", "class": "shopping_cart_container" }, [
+            el("a", { "class": "shopping_cart_link", "data-test": "shopping-cart-link", href: "cart.html", text: "Cart" })
+        ]);
+        var secondary = el("div", { "class": "header_secondary_container" }, (title ? [
+            el("span", { "class": "title", "data-test": "title", text: title })
+        ] : []).concat(extra || []));
+
+        document.getElementById("root").appendChild(el("div", { id: "header_container", "class": "header_container" }, [
+            el("div", { "class": "primary_header" }, [burger, el("div", { "class": "app_logo", text: "Swag Labs" }), cart]),
+            secondary
+        ]));
+        renderBadge();
+    }
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) { return; }
+        var badge = link.querySelector(".shopping_cart_badge");
+        var count = getCart().length;
+        if (count && !badge) {
+            badge = el("span", { "class": "shopping_cart_badge", "data-test": "shopping-cart-badge" });
+            link.appendChild(badge);
+        }
+        if (count) {
+            badge.textContent = String(count);
+        } else if (badge) {
+            badge.remove();
+        }
+    }
+
+    function cartToggleButton(product, detailPage) {
+        var button = el("button", { "class": "btn btn_small btn_inventory" });
+        function refresh() {
+            var inCart = getCart().indexOf(product.id) !== -1;
+            button.textContent = inCart ? "Remove" : "Add to cart";
+            button.className = "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary");
+            // detail page uses the short ids "add-to-cart" / "remove"
+            button.id = (inCart ? "remove" : "add-to-cart") + (detailPage ? "" : "-" + slug(product.name));
+            button.setAttribute("data-test", (inCart ? "remove-" : "add-to-cart-") + slug(product.name));
+        }
+        button.addEventListener("click", function () {
+            var ids = getCart();
+            var index = ids.indexOf(product.id);
+            if (index === -1) { ids.push(product.id); } else { ids.splice(index, 1); }
+            saveCart(ids);
+            refresh();
+        });
+        refresh();
+        return button;
+    }
+
+    function itemLabel(product, tag) {
+        return el("div", { "class": "inventory_item_label" }, [
+            el("a", { href: "inventory-item.html?id=" + product.id, id: "item_" + product.id + "_title_link" }, [
+                el("div", { "class": "inventory_item_name", "data-test": "inventory-item-name", text: product.name })
+            ]),
+            el(tag || "div", { "class": "inventory_item_desc", "data-test": "inventory-item-desc", text: product.description })
+        ]);
+    }
+
+    function requireLogin(path) {
+        if (!getCookie("session-username")) {
+            window.sessionStorage.setItem("login-error", "Epic sadface: You can only access '/" + path + "' when you are logged in.");
+            go("./");
+            return false;
+        }
+        return true;
+    }
+
+    function cartList(products, withRemove) {
+        var list = el("div", { "class": "cart_list", "data-test": "cart-list" }, [
+            el("div", { "class": "cart_quantity_label", text: "QTY" }),
+            el("div", { "class": "cart_desc_label", text: "Description" })
+        ]);
+        products.forEach(function (product) {
+            var pricebar = el("div", { "class": "item_pricebar" }, [
+                el("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", text: money(product.price) })
+            ]);
+            var item = el("div", { "class": "cart_item", "data-test": "inventory-item" }, [
+                el("div", { "class": "cart_quantity", "data-test": "item-quantity", text: "1" }),
+                el("div", { "class": "cart_item_label" }, [itemLabel(product), pricebar])
+            ]);
+            if (withRemove) {
+                pricebar.appendChild(el("button", {
+                    "class": "btn btn_secondary btn_small cart_button",
+                    id: "remove-" + slug(product.name),
+                    "data-test": "remove-" + slug(product.name),
+                    text: "Remove",
+                    onclick: function () {
+                        saveCart(getCart().filter(function (id) { return id !== product.id; }));
+                        item.remove();
+                    }
+                }));
+            }
+            list.appendChild(item);
+        });
+        return list;
+    }
+
+    // ---------- PAGES ----------
+    var pages = {};
+
+    pages.login = function (root) {
+        var errorBox = el("div", { "class": "error-message-container" });
+        var username = el("input", { id: "user-name", "class": "input_error form_input", "data-test": "username", type: "text", placeholder: "Username" });
+        var password = el("input", { id: "password", "class": "input_error form_input", "data-test": "password", type: "password", placeholder: "Password" });
+        var form = el("form", {}, [
+            el("div", { "class": "form_group" }, [username]),
+            el("div", { "class": "form_group" }, [password]),
+            errorBox,
+            el("input", { id: "login-button", "class": "submit-button btn_action", "data-test": "login-button", type: "submit", value: "Login" })
+        ]);
+
+        function showError(message) {
+            errorBox.innerHTML = "";
+            errorBox.className = "error-message-container error";
+            errorBox.appendChild(el("h3", { "data-test": "error", text: message }));
+        }
+
+        form.addEventListener("submit", function (e) {
+            e.preventDefault();
+            if (!username.value) { return showError("Epic sadface: Username is required"); }
+            if (!password.value) { return showError("Epic sadface: Password is required"); }
+            if (USERS.indexOf(username.value) === -1 || password.value !== PASSWORD) {
+                return showError("Epic sadface: Username and password do not match any user in this service");
+            }
+            if (username.value === "locked_out_user") {
+                return showError("Epic sadface: Sorry, this user has been locked out.");
+            }
+            setSession(username.value);
+            go("inventory.html");
+        });
+
+        root.appendChild(el("div", { "class": "login_logo", text: "Swag Labs" }));
+        root.appendChild(el("div", { "class": "login_wrapper" }, [form]));
+
+        var pendingError = window.sessionStorage.getItem("login-error");
+        if (pendingError) {
+            window.sessionStorage.removeItem("login-error");
+            showError(pendingError);
+        }
+    };
+
+    pages.inventory = function (root) {
+        if (!requireLogin("inventory.html")) { return; }
+        var sorters = {
+            az: function (a, b) { return a.name.localeCompare(b.name); },
+            za: function (a, b) { return b.name.localeCompare(a.name); },
+            lohi: function (a, b) { return a.price - b.price; },
+            hilo: function (a, b) { return b.price - a.price; }
+        };
+        var select = el("select", { "class": "product_sort_container", "data-test": "product-sort-container" }, [
+            el("option", { value: "az", text: "Name (A to Z)" }),
+            el("option", { value: "za", text: "Name (Z to A)" }),
+            el("option", { value: "lohi", text: "Price (low to high)" }),
+            el("option", { value: "hilo", text: "Price (high to low)" })
+        ]);
+        var list = el("div", { "class": "inventory_list", "data-test": "inventory-list" });
+
+        function renderList() {
+            list.innerHTML = "";
+            PRODUCTS.slice().sort(sorters[select.value]).forEach(function (product) {
+                list.appendChild(el("div", { "class": "inventory_item", "data-test": "inventory-item" }, [
+                    el("div", { "class": "inventory_item_img" }, [
+                        el("a", { href: "inventory-item.html?id=" + product.id, id: "item_" + product.id + "_img_link" }, [
+                            el("img", { "class": "inventory_item_img", alt: product.name, src: "static/img/" + product.image })
+                        ])
+                    ]),
+                    el("div", { "class": "inventory_item_description" }, [
+                        itemLabel(product),
+                        el("div", { "class": "pricebar" }, [
+                            el("div", { "class": "inventory_item_price", "data-test": "inventory-item-price", text: money(product.price) }),
+                            cartToggleButton(product)
+                        ])
+                    ])
+                ]));
+            });
+        }
+
+        select.addEventListener("change", renderList);
+        renderHeader("Products", [select]);
+        root.appendChild(el("div", { id: "inventory_container", "class": "inventory_container" }, [list]));
+        renderList();
+    };
+
+    pages.item = function (root) {
+        if (!requireLogin("inventory-item.html")) { return; }
+        var id = parseInt(new URLSearchParams(window.location.search).get("id"), 10);
+        var product = findProduct(id);
+        renderHeader("", [
+            el("button", { id: "back-to-products", "class": "inventory_details_back_button", type: "button", text: "Back to products", onclick: function () {
+                go("inventory.html");
+            } })
+        ]);
+        if (!product) {
+            root.appendChild(el("div", { "class": "inventory_details_name large_size", text: "ITEM NOT FOUND" }));
+            return;
+        }
+        root.appendChild(el("div", { "class": "inventory_details", "data-test": "inventory-container" }, [
+            el("div", { "class": "inventory_details_container" }, [
+                el("div", { "class": "inventory_details_img_container" }, [
+                    el("img", { "class": "inventory_details_img", alt: product.name, src: "static/img/" + product.image })
+                ]),
+                el("div", { "class": "inventory_details_desc_container" }, [
+                    el("div", { "class": "inventory_details_name large_size", "data-test": "inventory-item-name", text: product.name }),
+                    el("div", { "class": "inventory_details_desc large_size", "data-test": "inventory-item-desc", text: product.description }),
+                    el("div", { "class": "inventory_details_price", "data-test": "inventory-item-price", text: money(product.price) }),
+                    cartToggleButton(product, true)
+                ])
+            ])
+        ]));
+    };
+
+    pages.cart = function (root) {
+        if (!requireLogin("cart.html")) { return; }
+        renderHeader("Your Cart");
+        root.appendChild(el("div", { id: "cart_contents_container", "class": "cart_contents_container" }, [
+            cartList(cartProducts(), true),
+            el("div", { "class": "cart_footer" }, [
+                el("button", { id: "continue-shopping", "class": "btn btn_secondary back btn_medium", type: "button", text: "Continue Shopping", onclick: function () {
+                    go("inventory.html");
+                } }),
+                // Same as saucedemo: checkout stays enabled with an empty cart (known issue)
+                el("button", { id: "checkout", "class": "btn btn_action btn_medium checkout_button", type: "button", text: "Checkout", onclick: function () {
+                    go("checkout-step-one.html");
+                } })
+            ])
+        ]));
+    };
+
+    pages.checkoutStepOne = function (root) {
+        if (!requireLogin("checkout-step-one.html")) { return; }
+        renderHeader("Checkout: Your Information");
+        var errorBox = el("div", { "class": "error-message-container" });
+        var fields = [
+            ["first-name", "firstName", "First Name"],
+            ["last-name", "lastName", "Last Name"],
+            ["postal-code", "postalCode", "Zip/Postal Code"]
+        ].map(function (field) {
+            return el("input", { id: field[0], "class": "input_error form_input", "data-test": field[1], type: "text", placeholder: field[2] });
+        });
+        var form = el("form", {}, [
+            el("div", { "class": "checkout_info" }, fields.map(function (input) {
+                return el("div", { "class": "form_group" }, [input]);
+            }).concat([errorBox])),
+            el("div", { "class": "checkout_buttons" }, [
+                el("button", { id: "cancel", "class": "btn btn_secondary back btn_medium cart_cancel_link", type: "button", text: "Cancel", onclick: function () {
+                    go("cart.html");
+                } }),
+                el("input", { id: "continue", "class": "submit-button btn btn_primary cart_button btn_action", "data-test": "continue", type: "submit", value: "Continue" })
+            ])
+        ]);
+        form.addEventListener("submit", function (e) {
+            e.preventDefault();
+            var labels = ["First Name", "Last Name", "Postal Code"];
+            for (var i = 0; i < fields.length; i++) {
+                if (!fields[i].value) {
+                    errorBox.innerHTML = "";
+                    errorBox.className = "error-message-container error";
+                    errorBox.appendChild(el("h3", { "data-test": "error", text: "Error: " + labels[i] + " is required" }));
+                    return;
+                }
+            }
+            go("checkout-step-two.html");
+        });
+        root.appendChild(el("div", { id: "checkout_info_container", "class": "checkout_info_container" }, [form]));
+    };
+
+    pages.checkoutStepTwo = function (root) {
+        if (!requireLogin("checkout-step-two.html")) { return; }
+        renderHeader("Checkout: Overview");
+        var products = cartProducts();
+        var subtotal = products.reduce(function (sum, p) { return sum + p.price; }, 0);
+        var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+        root.appendChild(el("div", { id: "checkout_summary_container", "class": "checkout_summary_container" }, [
+            cartList(products, false),
+            el("div", { "class": "summary_info" }, [
+                el("div", { "class": "summary_info_label", text: "Payment Information:" }),
+                el("div", { "class": "summary_value_label", text: "SauceCard #31337" }),
+                el("div", { "class": "summary_info_label", text: "Shipping Information:" }),
+                el("div", { "class": "summary_value_label", text: "Free Pony Express Delivery!" }),
+                el("div", { "class": "summary_info_label", text: "Price Total" }),
+                el("div", { "class": "summary_subtotal_label", "data-test": "subtotal-label", text: "Item total: " + money(subtotal) }),
+                el("div", { "class": "summary_tax_label", "data-test": "tax-label", text: "Tax: " + money(tax) }),
+                el("div", { "class": "summary_total_label", "data-test": "total-label", text: "Total: " + money(subtotal + tax) }),
+                el("div", { "class": "cart_footer" }, [
+                    // Same as saucedemo: cancel goes back to inventory instead of cart (known issue)
+                    el("button", { id: "cancel", "class": "btn btn_secondary back btn_medium cart_cancel_link", type: "button", text: "Cancel", onclick: function () {
+                        go("inventory.html");
+                    } }),
+                    el("button", { id: "finish", "class": "btn btn_action btn_medium cart_button", type: "button", text: "Finish", onclick: function () {
+                        saveCart([]);
+                        go("checkout-complete.html");
+                    } })
+                ])
+            ])
+        ]));
+    };
+
+    pages.checkoutComplete = function (root) {
+        if (!requireLogin("checkout-complete.html")) { return; }
+        renderHeader("Checkout: Complete!");
+        root.appendChild(el("div", { id: "checkout_complete_container", "class": "checkout_complete_container" }, [
+            el("h2", { "class": "complete-header", "data-test": "complete-header", text: "Thank you for your order!" }),
+            el("div", { "class": "complete-text", text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!" }),
+            el("button", { id: "back-to-products", "class": "btn btn_primary btn_small", type: "button", text: "Back Home", onclick: function () {
+                go("inventory.html");
+            } })
+        ]));
+    };
+
+    pages[document.body.getAttribute("data-page")](document.getElementById("root"));
+})();
@@ -0,0 +1,205 @@
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from pages import locators
+from utils.config import get_base_url, get_profile
+from utils.element_cache import ElementCache
+from utils.waits import DomMutationWatcher, TimedWait
+
+class sauceDemoBasePage:
+    """Shared constructor, waits and navigation for all SauceDemo page objects"""
+
+    #ROUTE (relative to base URL)
+    URL_PATH = ""
+    #READINESS CONTRACT: element that means "this page can be used" (set by each page)
+    READY_LOCATOR = None
+
+    #SCRIPTS
+    #Read every field of every item (inventory card / cart row) in ONE round trip.
+    #Async: images still loading are given up to arguments[1] ms before the data is returned.
+    #arguments[0] = css selector of one item
+    SCRAPE_ITEMS_SCRIPT = """
+        var done = arguments[arguments.length - 1];
+        var items = Array.prototype.slice.call(document.querySelectorAll(arguments[0]));
+        var finished = false;
+
+        function text(item, selector) {
+            var node = item.querySelector(selector);
+            return node ? node.innerText.trim() : null;
+        }
+        function collect() {
+            if (finished) { return; }
+            finished = true;
+            done(items.map(function (item) {
+                var img = item.querySelector("img");
+                return {
+                    name: text(item, ".inventory_item_name, .inventory_details_name"),
+                    description: text(item, ".inventory_item_desc, .inventory_details_desc"),
+                    price: text(item, ".inventory_item_price, .inventory_details_price"),
+                    quantity: text(item, ".cart_quantity"),
+                    image_src: img ? img.getAttribute("src") : null,
+                    image_natural_width: img ? img.naturalWidth : 0,
+                    image_complete: img ? img.complete : false,
+                    image_element: img,
+                    name_element: item.querySelector(".inventory_item_name, .inventory_details_name")
+                };
+            }));
+        }
+
+        var loading = items.map(function (item) { return item.querySelector("img"); })
+                           .filter(function (img) { return img && !img.complete; });
+        if (!loading.length) { collect(); return; }
+        var left = loading.length;
+        setTimeout(collect, arguments[1]);
+        loading.forEach(function (img) {
+            function settled() { if (--left === 0) { collect(); } }
+            img.addEventListener("load", settled);
+            img.addEventListener("error", settled);
+        });
+    """
+
+    #Health of all images matching arguments[0] in ONE round trip (async, same image wait as above)
+    IMAGE_REPORT_SCRIPT = """
+        var done = arguments[arguments.length - 1];
+        var images = Array.prototype.slice.call(document.querySelectorAll(arguments[0]));
+        var finished = false;
+
+        function report() {
+            if (finished) { return; }
+            finished = true;
+            var seen = {};
+            images.forEach(function (img) {
+                var src = img.getAttribute("src");
+                seen[src] = (seen[src] || 0) + 1;
+            });
+            done(images.map(function (img, index) {
+                var src = img.getAttribute("src");
+                var item = img.closest(".inventory_item, .inventory_details, .cart_item");
+                var name = item && item.querySelector(".inventory_item_name, .inventory_details_name");
+                return {
+                    index: index,
+                    item_name: name ? name.innerText.trim() : img.getAttribute("alt"),
+                    src: src,
+                    complete: img.complete,
+                    natural_width: img.naturalWidth,
+                    loaded: img.complete && img.naturalWidth > 0,
+                    duplicate_src: !!src && seen[src] > 1
+                };
+            }));
+        }
+
+        var loading = images.filter(function (img) { return !img.complete; });
+        if (!loading.length) { report(); return; }
+        var left = loading.length;
+        setTimeout(report, arguments[1]);
+        loading.forEach(function (img) {
+            function settled() { if (--left === 0) { report(); } }
+            img.addEventListener("load", settled);
+            img.addEventListener("error", settled);
+        });
+    """
+
+    #LOCATORS (header, same on every page after login)
+    SHOPPING_CART_BADGE = locators.SHOPPING_CART_BADGE
+
+    #CONSTRUCTOR
+    def __init__(self, driver, base_url=None):
+        self.driver = driver
+        self.base_url = base_url or get_base_url()
+        self.wait = self.get_wait()
+        self.elements = ElementCache(driver, self.wait) #located elements of the current page state
+
+    #NAVIGATION
+    def get_url(self, path=None):
+        return self.base_url + (self.URL_PATH if path is None else path)
+
+    def open(self):
+        """Deep-link to this page (needs a logged-in session for pages after login)"""
+        self.driver.get(self.get_url())
+        return self.wait_until_ready()
+
+    def wait_until_ready(self, locator=None):
+        """
+        Wait for the readiness contract of this page (or of the page `locator` belongs to),
+        not for every image/script: browsers run with pageLoadStrategy "eager"
+        """
+        locator = locator or self.READY_LOCATOR
+        if locator is not None:
+            self.wait.until(EC.presence_of_element_located(locator))
+        return self
+
+    #WAITS
+    def get_wait(self, timeout=None, poll_frequency=None, ignored_exceptions=None):
+        """Timed wait with the profile timeout / poll interval (override per call if needed)"""
+        profile = get_profile()
+        return TimedWait(
+            self.driver,
+            profile.timeout if timeout is None else timeout,
+            poll_frequency=profile.poll_interval if poll_frequency is None else poll_frequency,
+            ignored_exceptions=ignored_exceptions,
+        )
+
+    #ELEMENT CACHE
+    def find(self, locator):
+        """Element from the page cache: located once per page state, located again when stale"""
+        return self.elements.get(locator)
+
+    def find_visible(self, locator):
+        """Like find(), but on a cache miss wait until the element is visible"""
+        return self.elements.get(locator, lambda loc: self.wait.until(EC.visibility_of_element_located(loc)))
+
+    def watch_dom(self, root_selector="body"):
+        """Arm a MutationObserver on root_selector. Call it BEFORE the action that changes the page"""
+        return DomMutationWatcher(self.driver, root_selector).arm()
+
+    #BULK READ
+    def scrape_items(self, item_selector):
+        """
+        Structured data of all items matching item_selector with ONE execute_script
+        (instead of find_element + .text per field per item)
+        RETURN: LIST OF DICTIONARIES (name, description, price, quantity, image_*, *_element)
+        """
+        timeout_ms = int(get_profile().short_timeout * 1000)
+        return self.driver.execute_async_script(self.SCRAPE_ITEMS_SCRIPT, item_selector, timeout_ms)
+
+    def get_image_report(self, image_selector="img"):
+        """
+        Check ALL images on the page with one script call (cost does not grow with catalog size)
+        RETURN: LIST OF DICTIONARIES, one per image:
+                index, item_name, src, complete, natural_width, loaded, duplicate_src
+        """
+        timeout_ms = int(get_profile().short_timeout * 1000)
+        return self.driver.execute_async_script(self.IMAGE_REPORT_SCRIPT, image_selector, timeout_ms)
+
+    #CART BADGE
+    def read_cart_badge(self):
+        """
+        Current badge value without waiting (only for "what is in the cart now?").
+        No badge in the DOM means empty cart -> 0 (no more 2s timeout for this case)
+        """
+        badges = self.driver.find_elements(*self.SHOPPING_CART_BADGE)
+        if not badges:
+            return 0
+        return int(badges[0].text)
+
+    def get_cart_badge(self, expected=None, timeout=None):
+        """
+        Badge value. After an action pass the value the UI should show (`expected`):
+        the read then waits for it (wait_for_cart_badge). Without `expected` it is read at once.
+        """
+        if expected is None:
+            return self.read_cart_badge()
+        return self.wait_for_cart_badge(expected, timeout)
+
+    def wait_for_cart_badge(self, expected, timeout=None):
+        """
+        Wait until badge shows `expected` (0 = no badge), the badge may be re-rendered meanwhile.
+        RETURN: badge value, different from `expected` when the wait timed out (the caller asserts)
+        """
+        if timeout is None:
+            timeout = get_profile().short_timeout
+        wait = self.get_wait(timeout, ignored_exceptions=(StaleElementReferenceException,))
+        try:
+            wait.until(lambda d: self.read_cart_badge() == expected)
+        except TimeoutException:
+            pass #the value shown is returned, the test compares it with `expected`
+        return self.read_cart_badge()
@@ -1,34 +1,35 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import sauceDemoBasePage
+from pages import locators
+from utils.config import get_profile
 from selenium.webdriver.support.ui import Select
 
-class sauceDemoCartPage:
-    
-    #LOCATORS
-    CART_PAGE_TITLE     = (By.CLASS_NAME, "title")
-    CART_ITEM           = (By.CLASS_NAME, "cart_item")
-    CART_BADGE          = (By.CLASS_NAME, "shopping_cart_badge")
+class sauceDemoCartPage(sauceDemoBasePage):
+
+    URL_PATH = "cart.html"
+    READY_LOCATOR = locators.CART_LIST
+
+    #LOCATORS (registered in pages/locators.py)
+    CART_PAGE_TITLE     = locators.TITLE
+    CART_ITEM           = locators.CART_ITEM
+    CART_ITEM_SELECTOR  = locators.css(CART_ITEM) #for bulk scripts
+    CART_BADGE          = locators.SHOPPING_CART_BADGE
     
-    ITEM_QUANTITY       = (By.CLASS_NAME, "cart_quantity")
-    ITEM_NAME           = (By.CLASS_NAME, "inventory_item_name")
-    ITEM_PRICE          = (By.CLASS_NAME, "inventory_item_price")   
-    ITEM_DESCRIPTION    = (By.CLASS_NAME, "inventory_item_desc")    
-    BTN_REMOVE_ITEM     = (By.XPATH, "//button[contains(text(), 'Remove')]")
+    ITEM_QUANTITY       = locators.CART_QUANTITY
+    ITEM_NAME           = locators.ITEM_NAME
+    ITEM_PRICE          = locators.ITEM_PRICE
+    ITEM_DESCRIPTION    = locators.ITEM_DESCRIPTION
+    BTN_REMOVE_ITEM     = locators.CART_REMOVE_BUTTON
     
-    BTN_CONTINUE_SHOPPING = (By.ID, "continue-shopping")
-    BTN_CHECKOUT        = (By.ID, "checkout")
+    CART_LIST_SELECTOR  = locators.css(locators.CART_LIST) #root of the item list for DOM change watching
     
+    BTN_CONTINUE_SHOPPING = locators.CONTINUE_SHOPPING
+    BTN_CHECKOUT        = locators.CHECKOUT_BUTTON
     
-    # CONSTRUCTOR
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
     
     #ACTIONS
     def get_page_title(self):
-        element = self.wait.until(EC.visibility_of_element_located(self.CART_PAGE_TITLE))
-        return element.text
+        return self.find_visible(self.CART_PAGE_TITLE).text
     
     def get_all_cart_item(self):
         """Return list of element all item in cart"""
@@ -37,36 +38,72 @@ class sauceDemoCartPage:
         except:
             return []
 
+    def get_all_items_data(self):
+        """Get Text Data (QTY, NAME, DESC, PRICE) of all items in one script call"""
+        return [
+            {
+                "quantity": item["quantity"],
+                "name": item["name"],
+                "description": item["description"],
+                "price": item["price"]
+            }
+            for item in self.scrape_items(self.CART_ITEM_SELECTOR)
+        ]
+
     def get_item_data_by_index(self, index):
         """Get Text Data (QTY, NAME, DESC, PRICE) FROM ITEM BY INDEX"""
-        items = self.get_all_cart_item()
+        items = self.get_all_items_data()
         if not items:
             raise Exception("CART IS EMPTY!")
         
-        item = items[index]
-        return{
-            "quantity": item.find_element(*self.ITEM_QUANTITY).text,
-            "name": item.find_element(*self.ITEM_NAME).text,
-            "description": item.find_element(*self.ITEM_DESCRIPTION).text,
-            "price": item.find_element(*self.ITEM_PRICE).text
-        }
+        return items[index]
     
     def click_remove_item_by_index(self, index):
         """Click Remove Button on Item by Index"""
-        items = self.get_all_cart_item()
-        item = items[index]
-        button_remove = item.find_element(*self.BTN_REMOVE_ITEM)
-        button_remove.click()
+        buttons = self.driver.find_elements(*self.BTN_REMOVE_ITEM)
+        buttons[index].click()
         
+    def get_cart_item_count(self):
+        return len(self.get_all_cart_item())
+
+    def wait_for_item_count(self, expected, watcher=None, timeout=None):
+        """Wait until cart has `expected` items, re-checked on every DOM change (no sleep)"""
+        watcher = watcher or self.watch_dom(self.CART_LIST_SELECTOR)
+        return watcher.wait_until(
+            lambda: self.get_cart_item_count() == expected,
+            timeout or get_profile().timeout,
+            "sauceDemoCartPage.wait_for_item_count",
+        )
+
+    def remove_items(self, indices):
+        """
+        Remove items by position in the cart: remove buttons fetched once and clicked through WebDriver,
+        then ONE wait until the list has that many items less. RETURN: items left
+        """
+        indices = list(indices)
+        buttons = self.driver.find_elements(*self.BTN_REMOVE_ITEM)
+        for index in indices:
+            if not 0 <= index < len(buttons):
+                raise Exception(f"Cart item index {index} not found!")
+        targets = [buttons[index] for index in dict.fromkeys(indices)]
+
+        expected = len(buttons) - len(targets)
+        watcher = self.watch_dom(self.CART_LIST_SELECTOR)
+        for button in targets:
+            button.click()
+        self.wait_for_item_count(expected, watcher)
+        return expected
+
     def click_continue_shopping(self):
         element = self.wait.until(EC.element_to_be_clickable(self.BTN_CONTINUE_SHOPPING))
         element.click()
+        self.wait_until_ready(locators.INVENTORY_ITEM)
 
     def click_checkout(self):
         element = self.wait.until(EC.element_to_be_clickable(self.BTN_CHECKOUT))
         element.click()
+        self.wait_until_ready(locators.FIRST_NAME_INPUT)
         
     def is_checkout_enabled(self):
         """Check if checkout button is enabled"""
-        btn = self.driver.find_element(*self.BTN_CHECKOUT)
-        return btn.is_enabled()
\ No newline at end of file
+        return self.find(self.BTN_CHECKOUT).is_enabled()
\ No newline at end of file
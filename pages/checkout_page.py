@@ -1,68 +1,85 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import sauceDemoBasePage
+from pages import locators
 import re
 
-class sauceDemoCheckoutPage:
+class sauceDemoCheckoutPage(sauceDemoBasePage):
 
-    #LOCATORS
+    #ROUTES (one page object for the 3 checkout steps)
+    URL_PATH = "checkout-step-one.html"
+    STEP_URLS = {
+        "information": "checkout-step-one.html",
+        "overview": "checkout-step-two.html",
+        "complete": "checkout-complete.html",
+    }
+    #READINESS CONTRACT per step
+    READY_LOCATOR = locators.FIRST_NAME_INPUT
+    STEP_READY = {
+        "information": locators.FIRST_NAME_INPUT,
+        "overview": locators.FINISH_BUTTON,
+        "complete": locators.COMPLETE_HEADER,
+    }
+
+    #LOCATORS (registered in pages/locators.py)
     #Information page locators:
-    CHECKOUT_PAGE_TITLE    = (By.CLASS_NAME, "title")
-    INPUT_FIRST_NAME       = (By.ID, "first-name")
-    INPUT_LAST_NAME        = (By.ID, "last-name")
-    INPUT_POSTAL_CODE      = (By.ID, "postal-code")
-    BTN_CONTINUE           = (By.ID, "continue")
-    BTN_CANCEL             = (By.ID, "cancel")
-    ERROR_MESSAGE          = (By.CSS_SELECTOR, "h3[data-test='error']") 
+    CHECKOUT_PAGE_TITLE    = locators.TITLE
+    INPUT_FIRST_NAME       = locators.FIRST_NAME_INPUT
+    INPUT_LAST_NAME        = locators.LAST_NAME_INPUT
+    INPUT_POSTAL_CODE      = locators.POSTAL_CODE_INPUT
+    BTN_CONTINUE           = locators.CONTINUE_BUTTON
+    BTN_CANCEL             = locators.CANCEL_BUTTON
+    ERROR_MESSAGE          = locators.ERROR_MESSAGE
 
     #Overview page locators:
-    SUMMARY_ITEM_PRICE    = (By.CLASS_NAME, "inventory_item_price")
-    SUMMARY_SUBTOTAL      = (By.CLASS_NAME, "summary_subtotal_label")
-    SUMMARY_TAX           = (By.CLASS_NAME, "summary_tax_label")
-    SUMMARY_TOTAL         = (By.CLASS_NAME, "summary_total_label")
-    BTN_FINISH            = (By.ID, "finish")
+    SUMMARY_ITEM_PRICE    = locators.ITEM_PRICE
+    SUMMARY_SUBTOTAL      = locators.SUMMARY_SUBTOTAL
+    SUMMARY_TAX           = locators.SUMMARY_TAX
+    SUMMARY_TOTAL         = locators.SUMMARY_TOTAL
+    BTN_FINISH            = locators.FINISH_BUTTON
 
     #completed page locators:
-    COMPLETED_HEADER      = (By.CLASS_NAME, "complete-header")
-    BTN_BACK_HOME         = (By.ID, "back-to-products")
+    COMPLETED_HEADER      = locators.COMPLETE_HEADER
+    BTN_BACK_HOME         = locators.BACK_TO_PRODUCTS
+
+    #NAVIGATION
+    def open(self, step="information"):
+        """Deep-link to a checkout step: information / overview / complete"""
+        self.driver.get(self.get_url(self.STEP_URLS[step]))
+        return self.wait_until_ready(self.STEP_READY[step])
+
+    def wait_for_step(self, step):
+        """Wait until the browser is on the given checkout step and the step is ready"""
+        self.wait.until(EC.url_contains(self.STEP_URLS[step]))
+        return self.wait_until_ready(self.STEP_READY[step])
 
-    #CONSTRUCTOR
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-    
     #ACTIONS
     def get_page_title(self):
         """Get Page Title Text"""
-        element = self.wait.until(EC.visibility_of_element_located(self.CHECKOUT_PAGE_TITLE))
-        return element.text
+        return self.find_visible(self.CHECKOUT_PAGE_TITLE).text
     
     #INFORMATION PAGE ACTIONS
     def fill_information(self, fname, lname, postalcode):
         if fname is not None:
-            self.driver.find_element(*self.INPUT_FIRST_NAME).send_keys(fname)
+            self.find(self.INPUT_FIRST_NAME).send_keys(fname)
         if lname is not None:
-            self.driver.find_element(*self.INPUT_LAST_NAME).send_keys(lname)
+            self.find(self.INPUT_LAST_NAME).send_keys(lname)
         if postalcode is not None:
-            self.driver.find_element(*self.INPUT_POSTAL_CODE).send_keys(postalcode)
+            self.find(self.INPUT_POSTAL_CODE).send_keys(postalcode)
     
     def click_continue(self):
-        element = self.driver.find_element(*self.BTN_CONTINUE)
-        element.click()
+        self.find(self.BTN_CONTINUE).click()
     
     def click_cancel(self):
-        element = self.driver.find_element(*self.BTN_CANCEL)
-        element.click()
+        self.find(self.BTN_CANCEL).click()
     
     def get_error_message(self):
-        element = self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE))
-        return element.text
+        return self.find_visible(self.ERROR_MESSAGE).text
     
     def verify_fields_visible(self):
         return (
-            self.driver.find_element(*self.INPUT_FIRST_NAME).is_displayed() and
-            self.driver.find_element(*self.INPUT_LAST_NAME).is_displayed() and
-            self.driver.find_element(*self.INPUT_POSTAL_CODE).is_displayed()
+            self.find(self.INPUT_FIRST_NAME).is_displayed() and
+            self.find(self.INPUT_LAST_NAME).is_displayed() and
+            self.find(self.INPUT_POSTAL_CODE).is_displayed()
         )
     
     #INVOICE OVERVIEW PAGE ACTIONS
@@ -81,9 +98,9 @@ class sauceDemoCheckoutPage:
             match = re.search(r"(\d+\.\d+)", text)
             return float(match.group(1)) if match else 0.0
 
-        subtotal_text = self.driver.find_element(*self.SUMMARY_SUBTOTAL).text
-        tax_text = self.driver.find_element(*self.SUMMARY_TAX).text
-        total_text = self.driver.find_element(*self.SUMMARY_TOTAL).text
+        subtotal_text = self.find(self.SUMMARY_SUBTOTAL).text
+        tax_text = self.find(self.SUMMARY_TAX).text
+        total_text = self.find(self.SUMMARY_TOTAL).text
 
         return{
             "subtotal": parse_price(subtotal_text),
@@ -92,15 +109,15 @@ class sauceDemoCheckoutPage:
         }
     
     def click_finish(self):
-        element = self.driver.find_element(*self.BTN_FINISH)
-        element.click()
+        self.find(self.BTN_FINISH).click()
+        self.wait_until_ready(self.STEP_READY["complete"])
 
     #COMPLETED PAGE ACTIONS
     def get_completed_message(self):
-        return self.wait.until(EC.visibility_of_element_located(self.COMPLETED_HEADER)).text
+        return self.find_visible(self.COMPLETED_HEADER).text
     
     def click_back_home(self):
-        element = self.driver.find_element(*self.BTN_BACK_HOME)
-        element.click()
+        self.find(self.BTN_BACK_HOME).click()
+        self.wait_until_ready(locators.INVENTORY_ITEM)
 
     
\ No newline at end of file
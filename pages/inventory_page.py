@@ -1,39 +1,70 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import sauceDemoBasePage
+from pages import locators
+from utils.config import get_profile
 from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import StaleElementReferenceException
 
-class sauceDemoInventoryPage:
+class sauceDemoInventoryPage(sauceDemoBasePage):
 
-    #LOCATORS
-    PAGE_TITLE              = (By.CLASS_NAME, "title")
+    URL_PATH = "inventory.html"
+    READY_LOCATOR = locators.INVENTORY_ITEM
 
-    OPEN_SIDEBAR_MENU       = (By.ID, "react-burger-menu-btn")
-    CLOSE_SIDEBAR_MENU      = (By.ID, "react-burger-cross-btn")
+    #LOCATORS (registered in pages/locators.py)
+    PAGE_TITLE              = locators.TITLE
 
-    PRODUCT_SORTING         = (By.CLASS_NAME, "product_sort_container")
-    SHOPPING_CART           = (By.CLASS_NAME, "shopping_cart_link")
-    SHOPPING_CART_BADGE     = (By.CLASS_NAME, "shopping_cart_badge")
+    OPEN_SIDEBAR_MENU       = locators.OPEN_SIDEBAR_MENU
+    CLOSE_SIDEBAR_MENU      = locators.CLOSE_SIDEBAR_MENU
 
-    INVENTORY_ITEMS         = (By.CLASS_NAME, "inventory_item")
-    ALL_ADD_TO_CART_BUTTONS = (By.CSS_SELECTOR, "button.btn_inventory") #<-- Locator for all button add to card
+    PRODUCT_SORTING         = locators.PRODUCT_SORTING
+    SHOPPING_CART           = locators.SHOPPING_CART_LINK
 
-    ITEM_IMAGES             = (By.CSS_SELECTOR, "img.inventory_item_img")
-    ITEM_NAMES              = (By.CLASS_NAME, "inventory_item_name")
-    ITEM_DESCRIPTIONS       = (By.CLASS_NAME, "inventory_item_desc")
-    ITEM_PRICE              = (By.CLASS_NAME, "inventory_item_price")
+    INVENTORY_ITEMS         = locators.INVENTORY_ITEM
+    INVENTORY_ITEM_SELECTOR = locators.css(INVENTORY_ITEMS) #for bulk scripts
+    ALL_ADD_TO_CART_BUTTONS = locators.INVENTORY_BUTTON #<-- Locator for all button add to card
+
+    ITEM_IMAGES             = locators.ITEM_IMAGE
+    ITEM_IMAGE_SELECTOR     = locators.css(ITEM_IMAGES) #for bulk scripts
+    ITEM_NAMES              = locators.ITEM_NAME
+    ITEM_DESCRIPTIONS       = locators.ITEM_DESCRIPTION
+    ITEM_PRICE              = locators.ITEM_PRICE
     
-    LOGOUT_BUTTON           = (By.ID, "logout_sidebar_link")
+    LOGOUT_BUTTON           = locators.LOGOUT_BUTTON
+
+    #SCRIPTS
+    #name -> {name, id, button, in_cart} for every product card in ONE round trip (page order)
+    #arguments: item css, name css, button css
+    INVENTORY_INDEX_SCRIPT = """
+        var itemCss = arguments[0], nameCss = arguments[1], buttonCss = arguments[2];
+        var index = {};
+        document.querySelectorAll(itemCss).forEach(function (item) {
+            var name = item.querySelector(nameCss);
+            var button = item.querySelector(buttonCss);
+            var link = item.querySelector("a[id^='item_']");
+            if (!name || !button) { return; }
+            index[name.textContent.trim()] = {
+                name: name.textContent.trim(),
+                id: link ? parseInt(link.id.split("_")[1], 10) : null,
+                button: button,
+                in_cart: (button.getAttribute("data-test") || "").indexOf("remove-") === 0
+            };
+        });
+        return index;
+    """
 
     #CONSTRUCTOR
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+    def __init__(self, driver, base_url=None):
+        super().__init__(driver, base_url)
+        self._index = None #inventory index of the current page load
+
+    #NAVIGATION
+    def open(self):
+        self._index = None
+        return super().open()
 
     #ACTIONS
     def get_page_title(self):
-        element = self.wait.until(EC.visibility_of_element_located(self.PAGE_TITLE))
-        return element.text
+        return self.find_visible(self.PAGE_TITLE).text
     
     
     def click_sidebar_menu(self):
@@ -43,105 +74,136 @@ class sauceDemoInventoryPage:
     def click_cart_icon(self):
         element = self.wait.until(EC.element_to_be_clickable(self.SHOPPING_CART))
         element.click()
+        self.wait_until_ready(locators.CART_LIST)
     
-    def get_cart_badge_value(self):
-        #get cart badge value if 0, do RETURN
-        try:
-            short_wait = WebDriverWait(self.driver, 2)
-            element = short_wait.until(EC.visibility_of_element_located(self.SHOPPING_CART_BADGE))
-            return int(element.text)
-        except:
-            return 0
+    def get_cart_badge_value(self, expected=None):
+        #get cart badge value, no badge means 0. Pass `expected` after an action: waits for that value
+        return self.get_cart_badge(expected)
     
     def get_inventory_count(self):
         element = self.wait.until(EC.visibility_of_all_elements_located(self.INVENTORY_ITEMS))
         return len(element)
     
     def product_sorting(self, option_value):
-        element = self.wait.until(EC.visibility_of_element_located(self.PRODUCT_SORTING))
-        select = Select(element)
+        select = Select(self.find_visible(self.PRODUCT_SORTING))
         select.select_by_value(option_value)
+        self._index = None #cards are rendered again
 
     def get_active_sort_option(self):
         """ Retrieve text from the currently 
         selected option in the dropdownExample: 
         Return “Name (A to Z)” 
         """
-        element = self.wait.until(EC.visibility_of_element_located(self.PRODUCT_SORTING))
-        select = Select(element)
+        select = Select(self.find_visible(self.PRODUCT_SORTING))
         return select.first_selected_option.text
 
     
+    def get_inventory_index(self, refresh=False):
+        """
+        Product index of the page: {name: {"name", "id", "button", "in_cart"}} in page order, built with one script call
+        and kept until the page is opened / sorted again (or a button handle went stale)
+        """
+        if self._index is None or refresh:
+            self.wait.until(EC.presence_of_element_located(self.INVENTORY_ITEMS))
+            self._index = self.driver.execute_script(
+                self.INVENTORY_INDEX_SCRIPT,
+                self.INVENTORY_ITEM_SELECTOR,
+                locators.css(self.ITEM_NAMES),
+                locators.css(self.ALL_ADD_TO_CART_BUTTONS),
+            )
+        return self._index
+
+    def add_items_by_name(self, item_names):
+        """
+        Add several products by name: every "Add to cart" button is clicked through WebDriver
+        (visibility / overlay checks stay), then ONE wait until the badge shows the new count.
+        An item already in the cart has no add button -> Exception, nothing is clicked.
+        RETURN: badge value
+        """
+        index = self.get_inventory_index()
+        missing = [name for name in item_names if name not in index]
+        if missing:
+            raise Exception(f"Item {missing} not found!")
+        in_cart = [name for name in item_names if index[name]["in_cart"]]
+        if in_cart:
+            raise Exception(f"Item {in_cart} already in cart, cannot be added again!")
+
+        expected = self.read_cart_badge() + len(dict.fromkeys(item_names))
+        for name in dict.fromkeys(item_names):
+            try:
+                self.get_inventory_index()[name]["button"].click()
+            except StaleElementReferenceException:
+                #cards were rendered again, take the fresh button once
+                self.get_inventory_index(refresh=True)[name]["button"].click()
+        #buttons changed to "Remove", the handles of this index are not add buttons anymore
+        self._index = None
+
+        actual = self.wait_for_cart_badge(expected, get_profile().timeout)
+        if actual != expected:
+            raise Exception(f"Cart badge shows {actual} after adding {list(item_names)}, expected {expected}")
+        return actual
+
     def add_item_by_name(self, item_name):
-        xpath_dynamic = f"//div[text()='{item_name}']/ancestor::div[@class='inventory_item']//button"
-        btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, xpath_dynamic)))
-        btn.click()
-        self.wait.until(EC.text_to_be_present_in_element((By.XPATH, xpath_dynamic), "Remove"))
+        """Add one product by name (index lookup, no per-name XPath)"""
+        return self.add_items_by_name([item_name])
     
+    def add_items(self, indices):
+        """
+        Add products by position on the page (0 = first card): one click per card,
+        then ONE wait until the badge shows the new count. RETURN: badge value
+        """
+        indices = list(indices)
+        entries = list(self.get_inventory_index().values())
+        for index in indices:
+            if not 0 <= index < len(entries):
+                raise Exception(f"Item index {index} not found!")
+        names = [entries[index]["name"] for index in dict.fromkeys(indices)]
+        return self.add_items_by_name(names)
+
     def add_item_by_index(self, index):
-        buttons = self.wait.until(EC.visibility_of_all_elements_located(self.ALL_ADD_TO_CART_BUTTONS))
-
-        if index < len(buttons):
-            btn = buttons[index]
-            btn.click()
-            
-            def check_cart_text_updated(driver):
-                fresh_buttons = driver.find_elements(*self.ALL_ADD_TO_CART_BUTTONS)
-                return "Remove" in fresh_buttons[index].text
-            
-            self.wait.until(check_cart_text_updated)
-
-        else:
-            raise Exception(f"Item index {index} not found!")
+        return self.add_items([index])
         
     def get_all_items_data(self):
         """
-        Get all items data (Title, Description, Price, and Image) in one loop
+        Get all items data (Title, Description, Price, and Image) in one script call
         RETURN: LIST OF DICTIONARIES
         """
-        # FIND_ELEMENTS (Bulk/Plural) -> Returning LIST
-        # names = [Element_Title_1, Element_Title_2, Element_Title_3, ...]
-        items = self.wait.until(EC.visibility_of_all_elements_located(self.INVENTORY_ITEMS))
-        names = self.driver.find_elements(*self.ITEM_NAMES)
-        descriptions = self.driver.find_elements(*self.ITEM_DESCRIPTIONS)
-        prices = self.driver.find_elements(*self.ITEM_PRICE)
-        images = self.driver.find_elements(*self.ITEM_IMAGES)
-        
+        self.wait.until(EC.presence_of_element_located(self.INVENTORY_ITEMS))
         results = []
 
-        #looping as many times as the number of items
-        for i in range(len(names)):
-            data = {
-                "name": names[i].text,
-                "descriptions": descriptions[i].text,
-                "prices": prices[i].text,
-                "image_element": images[i], # Save images element for checking later
-                "name_element": images[i] #Save name element for click actions
-            }
-            results.append(data)
+        for item in self.scrape_items(self.INVENTORY_ITEM_SELECTOR):
+            results.append({
+                "name": item["name"],
+                "descriptions": item["description"],
+                "prices": item["price"],
+                "image_src": item["image_src"],
+                "image_loaded": bool(item["image_complete"] and item["image_natural_width"] > 0),
+                "image_element": item["image_element"], # Save images element for checking later
+                "name_element": item["name_element"] #Save name element for click actions
+            })
 
         return results
     
-    def check_image_loaded(self, image_element):
+    def get_item_images_report(self):
         """
-        Check are all images broken or not using java script
-        RETURN: True if all images is good
+        Check all product images in one call (complete, naturalWidth, src, same src used twice)
+        RETURN: LIST OF DICTIONARIES (see sauceDemoBasePage.get_image_report)
         """
-        return self.driver.execute_script(
-            "return arguments[0].complete && typeof arguments[0].naturalWidth != 'undefined' && arguments[0].naturalWidth > 0",
-            image_element
-        )
+        self.wait.until(EC.presence_of_element_located(self.ITEM_IMAGES))
+        return self.get_image_report(self.ITEM_IMAGE_SELECTOR)
     
     def click_item_image_by_index(self, index):
         """Click on the product images in order """
         images = self.wait.until(EC.visibility_of_all_elements_located(self.ITEM_IMAGES))
         #Choose one of them based on order number (index)
         images[index].click()
+        self.wait_until_ready(locators.DETAIL_NAME)
     
     def click_item_title_by_index(self, index):
         """Click on the product titles in order"""
         title = self.wait.until(EC.visibility_of_all_elements_located(self.ITEM_NAMES))
         title[index].click()
+        self.wait_until_ready(locators.DETAIL_NAME)
         
     def get_item_name_by_index(self, index):
         """Get item name by index without clicking"""
@@ -152,3 +214,4 @@ class sauceDemoInventoryPage:
         """Click logout from sidebar"""
         logout_btn = self.wait.until(EC.element_to_be_clickable(self.LOGOUT_BUTTON))
         logout_btn.click()
+        self.wait_until_ready(locators.LOGIN_BUTTON)
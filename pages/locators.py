@@ -0,0 +1,142 @@
+"""
+Central locator registry for all SauceDemo page objects.
+
+Every locator is registered once here and checked when this module is imported:
+- By.ID / By.CLASS_NAME are rewritten to the CSS selector chromedriver would use anyway
+  (so "title" by class and ".title" by css are seen as the same locator)
+- the same element registered twice under two names -> ValueError (share it instead)
+- text-matching XPath (text(), contains(...)) is refused, use data-test / id / css
+Page classes keep their own attribute names (#LOCATORS), pointing to these constants.
+"""
+import re
+from selenium.webdriver.common.by import By
+
+_registry = {}   # name -> (by, value)
+_owners = {}     # (by, value) -> name, to find duplicates
+
+SIMPLE_NAME = re.compile(r"^-?[A-Za-z_][\w-]*$")
+TEXT_XPATH = re.compile(r"text\(\)|contains\(|normalize-space\(")
+PAIRS = {"[": "]", "(": ")"}
+
+
+def normalize(by, value):
+    """(By.ID, "x") -> (css, "#x"), (By.CLASS_NAME, "x") -> (css, ".x"), others unchanged"""
+    if by in (By.ID, By.CLASS_NAME):
+        if not SIMPLE_NAME.match(value):
+            if by == By.CLASS_NAME:
+                raise ValueError(f"Invalid class name {value!r} (one class only, no spaces)")
+            return By.CSS_SELECTOR, f'[id="{css_string(value)}"]'
+        return By.CSS_SELECTOR, ("#" if by == By.ID else ".") + value
+    return by, value
+
+
+def css_string(value):
+    """Escape a value used inside a quoted CSS attribute selector"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def validate(name, by, value):
+    if by not in (By.CSS_SELECTOR, By.XPATH):
+        raise ValueError(f"{name}: unsupported strategy {by!r}")
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{name}: empty selector")
+    if by == By.XPATH and TEXT_XPATH.search(value):
+        raise ValueError(f"{name}: text-matching XPath {value!r}, use data-test / id / css instead")
+
+    #brackets and quotes must be balanced (catches most typos before a test runs)
+    stack, quote = [], None
+    for char in value:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in PAIRS:
+            stack.append(PAIRS[char])
+        elif char in PAIRS.values():
+            if not stack or stack.pop() != char:
+                raise ValueError(f"{name}: unbalanced {char!r} in {value!r}")
+    if stack or quote:
+        raise ValueError(f"{name}: unclosed bracket or quote in {value!r}")
+
+
+def _add(name, locator):
+    if name in _registry:
+        raise ValueError(f"Locator {name} is registered twice")
+    owner = _owners.get(locator)
+    if owner:
+        raise ValueError(f"Locator {name} {locator} is the same as {owner}, reuse {owner}")
+    _registry[name] = locator
+    _owners[locator] = name
+
+
+def register(name, by, value):
+    """Normalize, validate and register one locator. RETURN: (by, value) tuple for find_element(*...)"""
+    locator = normalize(by, value)
+    validate(name, *locator)
+    _add(name, locator)
+    return locator
+
+
+def css(locator):
+    """CSS selector string of a registered locator (for bulk scripts / DOM watchers)"""
+    by, value = locator
+    if by != By.CSS_SELECTOR:
+        raise ValueError(f"{locator} is not a css locator")
+    return value
+
+
+def get_registry():
+    """Copy of all registered locators: name -> (by, value)"""
+    return dict(_registry)
+
+
+#HEADER (same on every page after login)
+TITLE                   = register("TITLE", By.CLASS_NAME, "title")
+SHOPPING_CART_LINK      = register("SHOPPING_CART_LINK", By.CLASS_NAME, "shopping_cart_link")
+SHOPPING_CART_BADGE     = register("SHOPPING_CART_BADGE", By.CLASS_NAME, "shopping_cart_badge")
+OPEN_SIDEBAR_MENU       = register("OPEN_SIDEBAR_MENU", By.ID, "react-burger-menu-btn")
+CLOSE_SIDEBAR_MENU      = register("CLOSE_SIDEBAR_MENU", By.ID, "react-burger-cross-btn")
+LOGOUT_BUTTON           = register("LOGOUT_BUTTON", By.ID, "logout_sidebar_link")
+ERROR_MESSAGE           = register("ERROR_MESSAGE", By.CSS_SELECTOR, 'h3[data-test="error"]')
+BACK_TO_PRODUCTS        = register("BACK_TO_PRODUCTS", By.ID, "back-to-products")
+
+#LOGIN
+USERNAME_INPUT          = register("USERNAME_INPUT", By.ID, "user-name")
+PASSWORD_INPUT          = register("PASSWORD_INPUT", By.ID, "password")
+LOGIN_BUTTON            = register("LOGIN_BUTTON", By.ID, "login-button")
+
+#PRODUCT LISTS (inventory cards, cart rows, checkout overview rows)
+PRODUCT_SORTING         = register("PRODUCT_SORTING", By.CLASS_NAME, "product_sort_container")
+INVENTORY_ITEM          = register("INVENTORY_ITEM", By.CLASS_NAME, "inventory_item")
+INVENTORY_BUTTON        = register("INVENTORY_BUTTON", By.CSS_SELECTOR, "button.btn_inventory")
+ITEM_IMAGE              = register("ITEM_IMAGE", By.CSS_SELECTOR, "img.inventory_item_img")
+ITEM_NAME               = register("ITEM_NAME", By.CLASS_NAME, "inventory_item_name")
+ITEM_DESCRIPTION        = register("ITEM_DESCRIPTION", By.CLASS_NAME, "inventory_item_desc")
+ITEM_PRICE              = register("ITEM_PRICE", By.CLASS_NAME, "inventory_item_price")
+
+#PRODUCT DETAIL
+DETAIL_NAME             = register("DETAIL_NAME", By.CLASS_NAME, "inventory_details_name")
+DETAIL_DESCRIPTION      = register("DETAIL_DESCRIPTION", By.CLASS_NAME, "inventory_details_desc")
+DETAIL_PRICE            = register("DETAIL_PRICE", By.CLASS_NAME, "inventory_details_price")
+DETAIL_IMAGE            = register("DETAIL_IMAGE", By.CSS_SELECTOR, "img.inventory_details_img")
+
+#CART
+CART_LIST               = register("CART_LIST", By.CLASS_NAME, "cart_list")
+CART_ITEM               = register("CART_ITEM", By.CLASS_NAME, "cart_item")
+CART_QUANTITY           = register("CART_QUANTITY", By.CLASS_NAME, "cart_quantity")
+CART_REMOVE_BUTTON      = register("CART_REMOVE_BUTTON", By.CSS_SELECTOR, 'button[data-test^="remove-"]')
+CONTINUE_SHOPPING       = register("CONTINUE_SHOPPING", By.ID, "continue-shopping")
+CHECKOUT_BUTTON         = register("CHECKOUT_BUTTON", By.ID, "checkout")
+
+#CHECKOUT
+FIRST_NAME_INPUT        = register("FIRST_NAME_INPUT", By.ID, "first-name")
+LAST_NAME_INPUT         = register("LAST_NAME_INPUT", By.ID, "last-name")
+POSTAL_CODE_INPUT       = register("POSTAL_CODE_INPUT", By.ID, "postal-code")
+CONTINUE_BUTTON         = register("CONTINUE_BUTTON", By.ID, "continue")
+CANCEL_BUTTON           = register("CANCEL_BUTTON", By.ID, "cancel")
+SUMMARY_SUBTOTAL        = register("SUMMARY_SUBTOTAL", By.CLASS_NAME, "summary_subtotal_label")
+SUMMARY_TAX             = register("SUMMARY_TAX", By.CLASS_NAME, "summary_tax_label")
+SUMMARY_TOTAL           = register("SUMMARY_TOTAL", By.CLASS_NAME, "summary_total_label")
+FINISH_BUTTON           = register("FINISH_BUTTON", By.ID, "finish")
+COMPLETE_HEADER         = register("COMPLETE_HEADER", By.CLASS_NAME, "complete-header")
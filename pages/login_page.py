@@ -1,32 +1,30 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import sauceDemoBasePage
+from pages import locators
 
-class sauceDemoLoginPage:
-    
-    #LOCATORS
-    USERNAME_INPUT = (By.ID, "user-name")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.ID, "login-button")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, "h3[data-test='error']")
+class sauceDemoLoginPage(sauceDemoBasePage):
 
-    #CONSTRUCTOR
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+    URL_PATH = ""
+    READY_LOCATOR = locators.LOGIN_BUTTON
+
+    #LOCATORS
+    USERNAME_INPUT = locators.USERNAME_INPUT
+    PASSWORD_INPUT = locators.PASSWORD_INPUT
+    LOGIN_BUTTON = locators.LOGIN_BUTTON
+    ERROR_MESSAGE = locators.ERROR_MESSAGE
 
     #ACTIONS
     def open_page(self):
-        self.driver.get("https://www.saucedemo.com/")
+        self.open()
         self.driver.maximize_window()
 
     def enter_username(self, username):
-        element = self.wait.until(EC.visibility_of_element_located(self.USERNAME_INPUT))
+        element = self.find_visible(self.USERNAME_INPUT)
         element.clear() 
         element.send_keys(username)
 
     def enter_password(self, password):
-        element = self.wait.until(EC.visibility_of_element_located(self.PASSWORD_INPUT))
+        element = self.find_visible(self.PASSWORD_INPUT)
         element.clear()
         element.send_keys(password)
 
@@ -35,6 +33,5 @@ class sauceDemoLoginPage:
         elemen.click()
     
     def get_error_message(self):
-        elemen = self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE))
-        return elemen.text
+        return self.find_visible(self.ERROR_MESSAGE).text
     
\ No newline at end of file
@@ -1,145 +1,180 @@
+import contextlib
+import functools
 import unittest
-from selenium import webdriver
-import os
-from datetime import datetime
-import sys
-import json
+import time
 import logging
+from selenium.common.exceptions import InvalidSessionIdException
 from pages.login_page import sauceDemoLoginPage
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils.artifacts import capture_failure
+from utils.config import get_base_url, get_profile
+from utils.data_loader import get_test_data
+from utils.driver_pool import get_driver_pool
+from utils.element_cache import get_element_cache_stats
+from utils.profiler import get_profiler
+from utils.resource_profiles import get_resource_profile
+from utils.session_manager import get_session_cache
+from utils.waits import get_wait_telemetry
+from utils.phase_timings import get_phase_timings, outcome_of
+from utils.log_pipeline import log_event, set_test_context, setup_logging
 
 ##---1: BASE TEST LOGGED IN---
 class BaseTest(unittest.TestCase):
 
-    # 1. Setup Driver (Manual Path)
+    # 1. Setup Driver (from Driver Pool)
     def setUp(self):
         #Logging setup
         self.config_logging()
 
         self.logger.info("=====================================")
-        self.logger.info(f"STARTING TEST: {self._testMethodName}")
+        self.logger.info("STARTING TEST: %s", self._testMethodName)
+        self.logger.info("ENVIRONMENT: %s (%s)", get_profile().name, get_base_url())
         self.logger.info("=====================================")
+        log_event("test_start", self.__class__.__name__)
         
         
-        # 0. CHROME OPTIONS
-        options = webdriver.ChromeOptions()
-
-        # # Shutdown "Save Password" and "Password Leak Detection"
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "safebrowsing.enabled": False, # Turn Off safebrowsing
-            "profile.default_content_setting_values.notifications": 2, # Blokir notifikasi
-            "profile.password_manager_leak_detection": False,
-        }
-        options.add_experimental_option("prefs", prefs)  
-
-        # Argument for turning off other features that interrupt automation
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--headless")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-save-password-bubble")
-        options.add_argument("--no-sandbox") 
-        options.add_argument("--disable-dev-shm-usage") 
-        options.add_argument("--disable-features=PasswordLeakDetection")
-        
-        # # Remove bar "Chrome is being controlled by automated test software"
-        # options.add_experimental_option('useAutomationExtension', False)
-        # options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        
-        # current_folder = os.path.dirname(os.path.abspath(__file__)) # Folder 'tests'
-        # project_root = os.path.dirname(current_folder)              # Folder Project Utama
-        # driver_path = os.path.join(project_root, "chromedriver.exe")
-
-        # if os.path.exists(driver_path):
-        #     self.logger.info(f"Using ChromeDriver from: {driver_path}")
-        #     service = Service(driver_path)
-        #     self.driver = webdriver.Chrome(service=service, options=options)
-        # else:
-        #     self.logger.warning("ChromeDriver not found in project root. Using default driver path.")
-        #     self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-        self.driver = webdriver.Chrome(options=options)
-
-        self.driver.maximize_window()
-        self.logger.info("Browser Opened Successfully")
+        # 0. BROWSER FROM POOL
+        # Chrome is launched once per worker and reused (state is reset on release)
+        self.profiler = get_profiler()
+        if self.profiler:
+            self.profiler.current_test = self.id()
+        # Lean by default (no images/fonts/analytics), tests opt in with @resource_profile("full")
+        self.resource_profile = get_resource_profile(getattr(self, self._testMethodName), get_profile().resource_profile)
+        self.driver = get_driver_pool().acquire(self.resource_profile)
+        self.logger.info("Browser Opened Successfully (resources: %s)", self.resource_profile)
+        self._wait_mark = len(get_wait_telemetry().records)
+        self._element_cache_mark = get_element_cache_stats().snapshot()
 
     # 2. Logika Screenshot on Failure
     def tearDown(self):
-        
-        # Jika sys.exc_info()[0] (tipe exception) BUKAN None, berarti ada kegagalan.
-        test_failed = sys.exc_info()[0] is not None
-        if test_failed:
-            #create screenshots folder if not exists
-            if not os.path.exists('screenshots'):
-                os.makedirs('screenshots')
-
-            test_method_name = self._testMethodName 
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            file_name = f"screenshots/{test_method_name}_{timestamp}.png"
 
-            # AMBIL SCREENSHOT
+        # Outcome comes from the phase wrappers below (sys.exc_info() is always empty in tearDown)
+        if self.test_outcome in ("failed", "error"):
+            # AMBIL SCREENSHOT + DOM + CONSOLE + URL (written by a background thread, utils/artifacts.py)
+            self.artifact_folder = capture_failure(self.driver, self.id(), self._testMethodName)
+            self.logger.info("!! TEST FAILED: artifacts queued to %s", self.artifact_folder)
+
+        self.log_wait_telemetry()
+        self.log_element_cache()
+        # Session died / browser crashed during the test -> do not give it to the next test.
+        # Only a dead session: timeouts, missing or stale elements leave a healthy browser
+        # (other crashes are found by the pool reset on release / health check on acquire)
+        broken = isinstance(self.test_exception, InvalidSessionIdException)
+        if broken:
+            self.logger.warning("Browser error (%s), browser is recycled", self.test_exception.__class__.__name__)
+        get_driver_pool().release(self.driver, broken=broken)
+        if self.profiler:
+            self.profiler.current_test = None
+
+    # 3. Outcome + setUp / body / tearDown timings
+    # The three phases are wrapped on this instance: unittest (and pytest) call self.setUp(),
+    # getattr(self, methodName)() and self.tearDown(), so the exception of a phase is seen
+    # here before unittest records it in the result (public TestCase API only)
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.test_outcome = None
+        self.test_exception = None
+        self.setUp = self._phase("setup", self.setUp)
+        self.tearDown = self._phase("teardown", self.tearDown)
+        if hasattr(self, methodName):
+            setattr(self, methodName, self._phase("call", getattr(self, methodName)))
+
+    def _phase(self, phase, function):
+        # functools.wraps keeps the attributes of the test (ddt data, @resource_profile, skip flags)
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if phase == "setup":
+                self._begin_test()
+            elif phase == "teardown":
+                self._torn_down = True
+            start = time.perf_counter()
             try:
-                self.driver.save_screenshot(file_name)
-                self.logger.info(f"!! TEST FAILED: Screenshots saved on {file_name}")
-            except:
-                self.logger.info("FAILED TO TAKE SCREENSHOT")
-
-        try:
-            self.driver.quit()
-        except:
-            pass
+                result = function(*args, **kwargs)
+            except BaseException as e:
+                if phase != "teardown":
+                    self.test_outcome = outcome_of(e, self.failureException)
+                    self.test_exception = e
+                raise
+            finally:
+                self.phase_timings[phase] = self.phase_timings.get(phase, 0.0) + time.perf_counter() - start
+            if phase == "call" and self.test_outcome is None:
+                self.test_outcome = "passed"
+            return result
+        return timed
+
+    def _begin_test(self):
+        self.test_outcome = None
+        self.test_exception = None
+        self.phase_timings = {}
+        self.artifact_folder = None
+        self._torn_down = False
+        # registered first = runs last, also when setUp failed (unittest skips tearDown then)
+        self.addCleanup(self.finish_test)
+
+    @contextlib.contextmanager
+    def subTest(self, *args, **params):
+        # failures inside self.subTest() are collected by unittest, not raised by the test body
+        with super().subTest(*args, **params):
+            try:
+                yield
+            except BaseException as e:
+                outcome = outcome_of(e, self.failureException)
+                if outcome != "skipped" and self.test_outcome != "error":
+                    self.test_outcome = outcome
+                    self.test_exception = e
+                raise
+
+    def finish_test(self):
+        """Log outcome + phase timings, add them to the timing table of this worker"""
+        logger = getattr(self, "logger", logging.getLogger(self.__class__.__name__))
+        if not self._torn_down and getattr(self, "driver", None) is not None:
+            # setUp failed after the browser was taken (e.g. login): screenshot + release here.
+            # An error while doing it is only logged, the setUp error stays the reported one
+            try:
+                self.tearDown()
+            except Exception:
+                logger.exception("Cleanup after the failed setUp raised")
+        record = get_phase_timings().record(self.id(), self.test_outcome, self.phase_timings, self.artifact_folder)
+        logger.info(
+            "TEST %s: %s (setup %.2fs, body %.2fs, teardown %.2fs)",
+            self._testMethodName, (self.test_outcome or "unknown").upper(), record["setup"], record["call"], record["teardown"],
+        )
+        log_event("test_end", self.__class__.__name__, record["total"], self.test_outcome)
+        set_test_context(None)
+
+    def log_wait_telemetry(self):
+        """Summary of the explicit waits done by page objects during this test"""
+        records = get_wait_telemetry().records[self._wait_mark:]
+        total = sum(r["duration"] for r in records)
+        timeouts = [r["label"] for r in records if r["timed_out"]]
+        self.logger.info("WAITS: %d calls, %.2fs total, %d timeout(s) %s", len(records), total, len(timeouts), timeouts if timeouts else '')
+        
+    def log_element_cache(self):
+        """Element cache hits / misses of the page objects during this test"""
+        now = get_element_cache_stats().snapshot()
+        delta = {key: now[key] - self._element_cache_mark[key] for key in now}
+        self.logger.info("ELEMENT CACHE: %(hits)d hits, %(misses)d misses, %(relocations)d re-located (stale), %(invalidations)d cleared", delta)
         
     #logging function
     def config_logging(self):
+        #One queue + writer thread per process (utils/log_pipeline.py), files per worker:
+        #logs/automation_test_gw0.log (text) and logs/automation_test_gw0.jsonl (JSON events)
+        setup_logging()
+        set_test_context(self.id())
 
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        log_folder = os.path.join(project_root, 'logs')
-
-        #Creating logging folder
-        if not os.path.exists(log_folder):
-            os.makedirs(log_folder)
-
-        log_file_path = os.path.join(log_folder, 'automation_test.log')
-        #Format log
-        log_formatter = logging.Formatter("%(asctime)s - %(levelname)s = %(message)s")
-        
-        #Logger Object
+        #Logger Object (no own handlers, records go to the pipeline through the root logger)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
-        
-        #Checking handler
-        if not self.logger.handlers:
-            #File handler
-            file_handler = logging.FileHandler(log_file_path)
-            file_handler.setFormatter(log_formatter)
-            self.logger.addHandler(file_handler)
-            
-            #Console Handler
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(log_formatter)
-            self.logger.addHandler(console_handler)
 
 ##---2: BASE TEST LOGGED IN (for all features after login)---
 class BaseTestLoggedIn(BaseTest):
     def setUp(self):
         super().setUp()
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        data_path = os.path.join(current_dir, '..', 'data', 'users.json')
-
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-            # Mengambil data user pertama untuk login
-            valid_user = data['positive_cases'][0]
-            username = valid_user['username']
-            password = valid_user['password']           
+        # Mengambil data user pertama untuk login (parsed once per process)
+        valid_user = get_test_data().default_user
+        username = valid_user.username
+        password = valid_user.password
 
-        self.logger.info(f"--- Running Positive Test: {username} ---")
+        # Fast path: UI login only once per user per worker, then session injection
+        self.logger.info("--- Login as: %s (session cache) ---", username)
         self.login_page = sauceDemoLoginPage(self.driver)
-        self.login_page.open_page()
-        self.login_page.enter_username(username)
-        self.login_page.enter_password(password)
-        self.login_page.click_loginbtn()
\ No newline at end of file
+        get_session_cache().login(self.driver, username, password)
@@ -0,0 +1,105 @@
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from utils.artifacts import flush_artifacts
+from utils.html_report import render_report
+from utils.phase_timings import format_timing_table, get_phase_timings
+from utils.results_store import ResultsStore, write_summary
+from utils.workers import get_worker_id
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_FOLDER = os.path.join(PROJECT_ROOT, "Report_Test")
+RESULTS_FOLDER = os.path.join(REPORT_FOLDER, "results")
+
+_store = None
+_summary = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--env",
+        action="store",
+        default=None,
+        help="Environment profile from config/environments.json (same as TEST_ENV=<name>)",
+    )
+
+
+def pytest_configure(config):
+    #Must run before test modules are imported (profile is loaded once per process)
+    env_name = config.getoption("--env")
+    if env_name:
+        os.environ["TEST_ENV"] = env_name
+    #one run id for the log index, xdist workers inherit it from the controller
+    os.environ.setdefault("TEST_RUN_ID", datetime.now().strftime("%Y%m%d-%H%M%S"))
+
+
+def _is_worker(config):
+    #xdist sets workerinput only inside the worker processes
+    return hasattr(config, "workerinput")
+
+
+def pytest_sessionstart(session):
+    #only the main process / xdist controller writes results (workers forward their reports)
+    global _store
+    if not _is_worker(session.config) and not session.config.option.collectonly:
+        _store = ResultsStore(os.path.join(RESULTS_FOLDER, f"{os.environ['TEST_RUN_ID']}.jsonl"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    #runs in the process of the test: worker id + phase timings / artifacts travel with the report
+    outcome = yield
+    report = outcome.get_result()
+    if call.when != "call":
+        return
+    report.user_properties.append(("worker", get_worker_id()))
+    records = get_phase_timings().records
+    if records and records[-1]["test"].endswith(f".{item.name}"):
+        report.user_properties.append(("phases", records[-1]))
+
+
+def pytest_runtest_logreport(report):
+    #Written as soon as the test is done (reports of xdist workers arrive here too)
+    if _store is None or not (report.when == "call" or report.outcome != "passed"):
+        return
+    properties = dict(report.user_properties)
+    phases = properties.get("phases") or {}
+    outcome = phases.get("outcome") or report.outcome
+    _store.add({
+        "run_id": os.environ["TEST_RUN_ID"],
+        "nodeid": report.nodeid,
+        "phase": report.when,
+        "outcome": outcome,
+        "duration": round(report.duration, 3),
+        "worker": properties.get("worker", get_worker_id()),
+        "longrepr": report.longreprtext[-20000:] if report.failed else None,
+        "phases": phases or None,
+        "artifacts": phases.get("artifacts"),
+    })
+
+
+def pytest_sessionfinish(session):
+    if _is_worker(session.config):
+        #artifacts must be on disk before the controller renders the report
+        flush_artifacts()
+        return
+    if _store is None:
+        return
+    flush_artifacts()
+    _store.close()
+    _summary.update(write_summary(_store.path, os.path.join(REPORT_FOLDER, "Report_Summary.json")))
+    render_report(_store.path, os.path.join(REPORT_FOLDER, "report.html"))
+
+
+def pytest_terminal_summary(terminalreporter):
+    #setUp / body / tearDown split of the slowest tests (all workers)
+    timings = _summary.get("phase_timings", {}).get("tests")
+    if timings:
+        terminalreporter.write_sep("-", "test phase timings (slowest)")
+        terminalreporter.write_line(format_timing_table(timings))
+    if _store is not None:
+        terminalreporter.write_line(f"Report: {os.path.join(REPORT_FOLDER, 'report.html')} (results: {_store.path})")
@@ -8,6 +8,10 @@ from tests.base_test import BaseTestLoggedIn
 import pytest
 
 class TestProductDetailPage(BaseTestLoggedIn):
+
+    #"Sauce Labs Backpack", first item with the default sorting (Name A to Z)
+    FIRST_ITEM_ID = 4
+
     def setUp(self):
         super().setUp()
         self.inventory_page = sauceDemoInventoryPage(self.driver)
@@ -47,7 +51,7 @@ class TestProductDetailPage(BaseTestLoggedIn):
         """Case02: Validate Price, Desc, Back Button, Add to Cart Button Visibility"""
         self.logger.info("Scenario: UI Component Validation (Price, Desc, Buttons)")
         
-        self.inventory_page.click_item_title_by_index(0)
+        self.product_detail_page.open(self.FIRST_ITEM_ID)
         
         #Validate Components
         components = {
@@ -69,7 +73,7 @@ class TestProductDetailPage(BaseTestLoggedIn):
         """Case03: Validate Back Button Functionality"""
         self.logger.info("Scenario: Back Button Functionality")
 
-        self.inventory_page.click_item_title_by_index(0)
+        self.product_detail_page.open(self.FIRST_ITEM_ID)
 
         self.logger.info("STEP 1: USER CLICK BACK BUTTON")
         self.product_detail_page.click_back_button()
@@ -86,7 +90,7 @@ class TestProductDetailPage(BaseTestLoggedIn):
             Case 05: Remove from Cart Button Functionality"""
         self.logger.info("Scenario: Add/Remove Cart Logic on Detail Page")
         
-        self.inventory_page.click_item_title_by_index(0)
+        self.product_detail_page.open(self.FIRST_ITEM_ID)
         
         #---STEP 1: ADD TO CART---
         initial_badge = self.product_detail_page.get_cart_value_badge()
@@ -96,7 +100,7 @@ class TestProductDetailPage(BaseTestLoggedIn):
         self.product_detail_page.click_add_to_cart_or_remove_button()
         
         #Validation 1: Badge value increased
-        new_badge = self.product_detail_page.get_cart_value_badge()
+        new_badge = self.product_detail_page.get_cart_value_badge(expected=initial_badge + 1)
         if new_badge == initial_badge + 1:
             self.logger.info(f"SUCCESS: Badge increased to {new_badge}")
         else:
@@ -116,7 +120,7 @@ class TestProductDetailPage(BaseTestLoggedIn):
         self.product_detail_page.click_add_to_cart_or_remove_button()
 
         #Validation 1: Badge value decreased
-        final_badge = self.product_detail_page.get_cart_value_badge()
+        final_badge = self.product_detail_page.get_cart_value_badge(expected=initial_badge)
         if final_badge == initial_badge:
             self.logger.info(f"PASSED: Badge reset to {final_badge}")
         else:
@@ -134,11 +138,9 @@ class TestProductDetailPage(BaseTestLoggedIn):
 # --- (AUTO RUNNER) ---
 if __name__ == "__main__":
 
-    # pytest options
+    # pytest options (one report for every run: Report_Test/report.html, see tests/conftest.py)
     pytest_args = [
         __file__,                                  # running this file
-        "--html=Report_Test/Report_Detail_Product.html", # HTML Report to this folder
-        "--self-contained-html",                   
         "-v"                                       
     ]
     pytest.main(pytest_args)
@@ -1,7 +1,6 @@
 import unittest
 import sys
 import os
-import time
 import pytest
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -9,6 +8,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from pages.cart_page import sauceDemoCartPage
 from pages.inventory_page import sauceDemoInventoryPage
 from tests.base_test import BaseTestLoggedIn
+from utils.cart_seeder import seed_cart
+from utils.data_loader import get_products
 
 class TestSauceDemoCart(BaseTestLoggedIn):
     
@@ -18,6 +19,10 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         self.cart_page = sauceDemoCartPage(self.driver)
         
         self.logger.info("--- Cart Page Test Started ---")
+
+    def first_products(self, count):
+        """Names of the first N products (same order as the inventory page default sort)"""
+        return [product.name for product in get_products()[:count]]
         
     def test_01_access_cart_page(self):
         """CASE 1: Validate user successfully access cart page"""
@@ -37,8 +42,8 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """CASE 2 AND 3: VALIDATE EMPTY CART DISPLAY & BUTTONS"""
         self.logger.info("Scenario: Empty Cart Display & Buttons Visibility")
         
-        #Access Cart without items add
-        self.inventory_page.click_cart_icon()
+        #Access Cart without items add (deep-link)
+        self.cart_page.open()
         
         #Validate items is empty
         items = self.cart_page.get_all_cart_item()
@@ -69,19 +74,20 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """Case 4: Validate cart shows added items (2 items sample)"""
         self.logger.info("Scenario: Validate Item Count in Cart")
         
-        # Pre-condition: Add 2 items
+        # Pre-condition: Add 2 items through the inventory UI (end-to-end path, other cases seed the cart)
         self.logger.info("Adding 2 items from inventory...")
-        self.inventory_page.add_item_by_index(0) 
-        self.inventory_page.add_item_by_index(1) 
+        expected_names = [self.inventory_page.get_item_name_by_index(index) for index in range(2)]
+        self.inventory_page.add_items(range(2))
         
         self.inventory_page.click_cart_icon()
         
-        items = self.cart_page.get_all_cart_item()
+        items = self.cart_page.get_all_items_data()
         try:
             self.assertEqual(len(items), 2)
-            self.logger.info("SUCCESS: Cart contains 2 items.")
+            self.assertEqual([item['name'] for item in items], expected_names)
+            self.logger.info(f"SUCCESS: Cart contains 2 items: {expected_names}")
         except AssertionError as e:
-            self.logger.error(f"FAILED: Cart item count mismatch. Expected 2, Got {len(items)}")
+            self.logger.error(f"FAILED: Cart items mismatch. Expected {expected_names}, Got {[item['name'] for item in items]}")
             raise e
         
     def test_05_06_validate_item_details(self):
@@ -96,11 +102,8 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         
         self.logger.info(f"INFO: System selected item dynamically: {expected_item_name}")
         
-        #STEP 2: ADD ITEM TO CART BY NAME
-        self.inventory_page.add_item_by_name(expected_item_name)
-        
-        #STEP 3: GO TO CART
-        self.inventory_page.click_cart_icon()
+        #STEP 2 & 3: PUT ITEM IN CART BY NAME AND GO TO CART (one page load)
+        seed_cart(self.driver, [expected_item_name], page=self.cart_page)
         
         #STEP 4: Validate
         #Get first item data in cart
@@ -127,10 +130,9 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """Case 7: Validate Remove button functionality"""
         self.logger.info("Scenario: Remove Item from Cart")
         
-        #Adding 1 item
-        self.inventory_page.add_item_by_index(0)
-        initial_badge = self.inventory_page.get_cart_badge_value()
-        self.inventory_page.click_cart_icon()
+        #Seeding 1 item
+        seed_cart(self.driver, self.first_products(1), page=self.cart_page)
+        initial_badge = self.inventory_page.get_cart_badge_value(expected=1)
         
         #Remove action
         self.logger.info("Removing item...")
@@ -146,7 +148,7 @@ class TestSauceDemoCart(BaseTestLoggedIn):
             raise e
         
         #Validation 2 : badge count
-        final_badge = self.inventory_page.get_cart_badge_value()
+        final_badge = self.inventory_page.get_cart_badge_value(expected=initial_badge - 1)
         try:
             self.assertEqual(final_badge, initial_badge - 1)
             self.logger.info(f"PASSED: Badge updated from {initial_badge} to {final_badge}.")
@@ -158,7 +160,7 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """Case 8: Validate Continue Shopping button functionality"""
         self.logger.info("Scenario: Continue Shopping Navigation")
         
-        self.inventory_page.click_cart_icon()
+        self.cart_page.open()
         self.cart_page.click_continue_shopping()
         
         #Validate the redirection
@@ -175,12 +177,8 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """Case 9: Validate Checkout button functionality"""
         self.logger.info("Scenario: Checkout Navigation")
         
-        #First add item to cart
-        #self.inventory_page.add_item_by_index(1)
-        #self.inventory_page.add_item_by_index(2)
-        for i in range(2):
-            self.inventory_page.add_item_by_index(i)
-        self.inventory_page.click_cart_icon()
+        #First put 2 items in cart
+        seed_cart(self.driver, self.first_products(2), page=self.cart_page)
         
         self.cart_page.click_checkout()
         
@@ -197,16 +195,13 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         
         self.logger.info("Scenario: Remove All Items Loop")
         
-        #add 3 items
-        for i in range(3):
-            self.inventory_page.add_item_by_index(i)
+        #3 items in cart
+        seed_cart(self.driver, self.first_products(3), page=self.cart_page)
         
-        self.inventory_page.click_cart_icon()
-        
-        #Deleted 1 by 1 until cart is empty
-        while len(self.cart_page.get_all_cart_item()) > 0:
-            self.cart_page.click_remove_item_by_index(0)
-            time.sleep(0.5)
+        #Remove every item (one click per item, one wait until the list is updated)
+        item_count = self.cart_page.get_cart_item_count()
+        self.assertEqual(item_count, 3, "Seeded items are not shown in the cart")
+        self.cart_page.remove_items(range(item_count))
         
         items_left = self.cart_page.get_all_cart_item()
         try:
@@ -220,7 +215,7 @@ class TestSauceDemoCart(BaseTestLoggedIn):
         """CASE 11: [NEGATIVE CASE] Checkout button should be disabled if cart is empty"""
         
         self.logger.info("Scenario: Validate Checkout on Empty Cart")
-        self.inventory_page.click_cart_icon()
+        self.cart_page.open()
         
         #Check is the button enabled?
         self.logger.info("Checking if Checkout button is enabled...")
@@ -246,11 +241,9 @@ class TestSauceDemoCart(BaseTestLoggedIn):
 # --- (AUTO RUNNER) ---
 if __name__ == "__main__":
 
-    # pytest options
+    # pytest options (one report for every run: Report_Test/report.html, see tests/conftest.py)
     pytest_args = [
         __file__,                                  # running this file
-        "--html=Report_Test/Report_cart_page.html", # HTML Report to this folder
-        "--self-contained-html",                   
         "-v"                                       
     ]
 
@@ -0,0 +1,82 @@
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from pages.checkout_page import sauceDemoCheckoutPage
+from tests.base_test import BaseTestLoggedIn
+from utils.cart_seeder import seed_cart
+from utils.checkout_matrix import get_checkout_cases, get_matrix_settings
+
+MATRIX = get_matrix_settings()
+
+
+class CheckoutMatrixShard(BaseTestLoggedIn):
+    """
+    Data-driven checkout matrix (item subsets x names x postal codes).
+    One class per shard so pytest-xdist can send shards to different workers;
+    all cases of a shard run in ONE test with the same logged-in browser.
+    Cases are generated lazily while the shard runs (nothing built at import).
+    """
+
+    __test__ = False  # base only, the shard classes below are collected
+    SHARD_INDEX = 0
+
+    def setUp(self):
+        super().setUp()
+        self.checkout_page = sauceDemoCheckoutPage(self.driver)
+        self.logger.info(f"--- Checkout Matrix Shard {self.SHARD_INDEX + 1}/{MATRIX['shards']} Started ---")
+
+    def run_case(self, case):
+        #Cart of the shared browser set to exactly the items of this case, landing on step one
+        seed_cart(self.driver, case.items, page=self.checkout_page)
+        self.checkout_page.fill_information(case.firstname, case.lastname, case.postalcode)
+        self.checkout_page.click_continue()
+
+        if case.expected_error:
+            self.assertEqual(self.checkout_page.get_error_message(), case.expected_error)
+            return
+
+        self.assertIn("checkout-step-two.html", self.driver.current_url)
+        summary = self.checkout_page.get_summary_values()
+        self.assertEqual(len(self.checkout_page.get_item_prices_as_float()), len(case.items))
+        self.assertEqual(summary['subtotal'], case.expected_subtotal)
+        self.assertEqual(summary['tax'], case.expected_tax)
+        self.assertEqual(round(summary['total'], 2), case.expected_total)
+
+    def test_checkout_matrix(self):
+        """Run every checkout case of this shard (soft assertion per case)"""
+        cases = get_checkout_cases(self.SHARD_INDEX, MATRIX['shards'], MATRIX['limit'], MATRIX['cases_file'])
+        failed = []
+        count = 0
+
+        for case in cases:
+            count += 1
+            with self.subTest(case=case.case_id):
+                try:
+                    self.run_case(case)
+                    self.logger.info(f"PASSED: {case.case_id} {len(case.items)} item(s), postal '{case.postalcode}'")
+                except AssertionError as e:
+                    failed.append(case.case_id)
+                    self.logger.error(f"FAILED: {case.case_id} {case} -> {e}")
+                    raise e
+
+        self.logger.info(f"Shard finished: {count} case(s), {len(failed)} failed {failed if failed else ''}")
+
+
+#One TestCase class per shard (same MATRIX_SHARDS in every xdist process -> same test ids)
+for _shard_index in range(MATRIX['shards']):
+    _name = f"TestCheckoutMatrixShard{_shard_index:02d}"
+    globals()[_name] = type(_name, (CheckoutMatrixShard,), {"__test__": True, "SHARD_INDEX": _shard_index})
+
+
+# --- (AUTO RUNNER) ---
+if __name__ == "__main__":
+
+    # pytest options (one report for every run: Report_Test/report.html, see tests/conftest.py)
+    pytest_args = [
+        __file__,                                  # running this file
+        "-v"                                       
+    ]
+    pytest.main(pytest_args)
@@ -4,6 +4,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from pages.inventory_page import sauceDemoInventoryPage
 from tests.base_test import BaseTestLoggedIn
+from utils.resource_profiles import resource_profile
 import re #<< for checking HTML logic
 import pytest
 
@@ -51,16 +52,14 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
         initial_cart_count = self.inventory_page.get_cart_badge_value()
         self.logger.info(f"Initial Cart Count: {initial_cart_count}")
         
-        #Second looping to add 3 items
-        self.logger.info(f"Adding {len(item_to_add)} items...")
-        for item in item_to_add:
-            self.logger.info(f"On process to add: {item}...")
-            self.inventory_page.add_item_by_name(item)
+        #Second add the 3 items (name index, one click per item + one wait for the badge)
+        self.logger.info(f"Adding {len(item_to_add)} items: {item_to_add}...")
+        self.inventory_page.add_items_by_name(item_to_add)
 
         #Check value on the cart > must be increased
         # Logic: Final Amount must be = First Amount (0) + Number of item in list (3)
         expected_total = initial_cart_count + len (item_to_add)
-        actual_total = self.inventory_page.get_cart_badge_value()
+        actual_total = self.inventory_page.get_cart_badge_value(expected=expected_total)
 
         self.logger.info(f"INFO: Total in cart: {actual_total}")
 
@@ -80,13 +79,13 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
         #Second we want to get the top of 3 items
         item_count_to_add = 3
         
-        for i in range(item_count_to_add):
-            self.logger.info(f"Adding item at index {i}...")
-            self.inventory_page.add_item_by_index(i)
+        #One click per item, one wait for the badge
+        self.logger.info(f"Adding items at index 0..{item_count_to_add - 1}...")
+        self.inventory_page.add_items(range(item_count_to_add))
         
         #Assert dynamic
         expected_total = initial_cart_count + item_count_to_add
-        actual_total = self.inventory_page.get_cart_badge_value()
+        actual_total = self.inventory_page.get_cart_badge_value(expected=expected_total)
 
         try:
             self.assertEqual(actual_total,expected_total)
@@ -151,6 +150,7 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
             raise e
 
 
+    @resource_profile("full") #images are checked
     def test_7_validate_item_content(self):
         """Case7: Verified image, descriptions (without HTML code leak), Title(without HTML code leak), and Price"""
         self.logger.info("Scenario: Validate Item Content (Soft Assertion for Bugs)")
@@ -158,6 +158,13 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
         all_items = self.inventory_page.get_all_items_data()
         errors = [] #Error Buffer (Soft Assertion)
 
+        #1. validate images not broken (all images checked in one call)
+        for image in self.inventory_page.get_item_images_report():
+            if not image['loaded']:
+                message = f"FAILED: Images broken for items '{image['item_name']}' ({image['src']})"
+                errors.append(message)
+                self.logger.warning(message)
+
         # Regex patterns for capturing leaked HTML or code
         # 1. <.*?>          : Captures any HTML tag (e.g., <div>, <br>, <b>)
         # 2. function\(\)   : Captures the text “function()”
@@ -167,12 +174,6 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
         self.logger.info(f"Scanning {len(all_items)} items for UI/Data defects...")
 
         for index, item in enumerate(all_items):
-            #1. validate images not broken
-            if not self.inventory_page.check_image_loaded(item['image_element']):
-                message = f"FAILED: Images broken for items '{item['name']}'"
-                errors.append(message)
-                self.logger.warning(message)
-                
             #2. validate price must be show and had "$" symbols
             if "$" not in item['prices']:
                 message = f"FAILED: Incorrect Price Format on the '{item['name']}': {item['prices']}"
@@ -204,6 +205,7 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
             self.logger.info("PASSED: All product contents are valid.")
 
 
+    @resource_profile("full") #image must be rendered to be clicked
     def test_8_click_image(self):
         """Case8: Validate if user clicking image it will redirect to product/item details"""
         self.logger.info("Scenario: Click Item Title Navigation")
@@ -252,11 +254,9 @@ class TestSauceDemoInventory(BaseTestLoggedIn):
 # --- (AUTO RUNNER) ---
 if __name__ == "__main__":
 
-    # pytest options
+    # pytest options (one report for every run: Report_Test/report.html, see tests/conftest.py)
     pytest_args = [
         __file__,                                  # running this file
-        "--html=Report_Test/Report_Inventory.html", # HTML Report to this folder
-        "--self-contained-html",                   
         "-v"                                       
     ]
     pytest.main(pytest_args)
\ No newline at end of file
@@ -7,21 +7,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from pages.login_page import sauceDemoLoginPage
 from pages.inventory_page import sauceDemoInventoryPage
 from tests.base_test import BaseTest
-import json
+from utils.data_loader import get_test_data
 from ddt import ddt, data
 
 
-# --- HELPER FUNCTION JSON ---
-def load_testdata(case_type):
-    #path file test script
-    current_dir = os.path.dirname(__file__)
-    data_path = os.path.join(current_dir, '..', 'data', 'users.json')
-
-    with open(data_path, 'r') as f:
-        data = json.load(f)
-        # Return key from list (ex: 'negative_cases')
-        return data.get(case_type, [])
-
 #--- TEST CASES CLASS ----
 @ddt
 class TestLoginSeparated(BaseTest):
@@ -34,14 +23,14 @@ class TestLoginSeparated(BaseTest):
         self.inventory_page = sauceDemoInventoryPage(self.driver)
         
     # 1. --- POSITIVE CASE FUNCTION ---
-    @data(*load_testdata('positive_cases')) #<--- CALL Helper Function
+    @data(*get_test_data().positive_logins) #<--- typed LoginCase records
 
     def test_01_positive_login(self, data_set):
         """LGN-01: Verify successful login with valid standard_user credentials. """
-        #Get the value, since data entry as a single dictionary
-        username = data_set['username']
-        password = data_set['password']
-        expected_url_part = data_set['expected_url_part']
+        #Get the value, since data entry is a single LoginCase record
+        username = data_set.username
+        password = data_set.password
+        expected_url_part = data_set.expected_url_part
         
         self.logger.info(f"--- Running Positive Test: {username} ---")
         self.login_page.enter_username(username)
@@ -61,17 +50,17 @@ class TestLoginSeparated(BaseTest):
             
             
     # 2. --- NEGATIVE CASE FUNCTION ---
-    @data(*load_testdata('negative_cases'))#<--- CALL Helper Function
+    @data(*get_test_data().negative_logins) #<--- typed LoginCase records
 
     def test_02_negative_login(self, data_set):
         """LGN-02,03,04: Verify error message when logging in with locked_out_user, 
         invalid username/password 
         and empty field checking
         """
-        #Get the value, since data entry as a single dictionary
-        username = data_set['username']
-        password = data_set['password']
-        expected_error = data_set['expected_error']
+        #Get the value, since data entry is a single LoginCase record
+        username = data_set.username
+        password = data_set.password
+        expected_error = data_set.expected_error
 
         self.logger.info(f"--- Running Negative Test: {username} ---")
         self.login_page.enter_username(username)
@@ -106,11 +95,9 @@ class TestLoginSeparated(BaseTest):
 # --- (AUTO RUNNER) ---
 if __name__ == "__main__":
 
-    # pytest options
+    # pytest options (one report for every run: Report_Test/report.html, see tests/conftest.py)
     pytest_args = [
         __file__,                                  # running this file
-        "--html=Report_Test/Report_Login.html", # HTML Report to this folder
-        "--self-contained-html",                   
         "-v"                                       
     ]
     pytest.main(pytest_args)
@@ -0,0 +1,77 @@
+"""Checkout matrix generation, sharding and expected totals (no browser)"""
+import itertools
+import json
+
+from utils.checkout_matrix import (
+    NAME_CASES, POSTAL_CASES, build_case, expected_error, generate_checkout_cases, get_checkout_cases, item_subsets,
+)
+from utils.data_loader import Product, get_products
+
+
+def product(price, name="Item"):
+    return Product(id=0, name=name, description="", price=price, image="")
+
+
+def test_full_matrix_has_every_combination_once():
+    cases = list(generate_checkout_cases())
+    assert len(cases) == 63 * len(NAME_CASES) * len(POSTAL_CASES) == 2520
+    assert len({case.case_id for case in cases}) == 2520
+    combinations = {(case.items, case.firstname, case.lastname, case.postalcode) for case in cases}
+    assert len(combinations) == 2520
+
+
+def test_item_subsets_cover_every_non_empty_combination():
+    subsets = item_subsets(get_products())
+    assert len(subsets) == 2 ** 6 - 1
+    assert len(set(subsets)) == len(subsets)
+
+
+def test_shards_split_the_matrix_without_overlap():
+    shards = [list(get_checkout_cases(index, 4, limit=24)) for index in range(4)]
+    assert [len(shard) for shard in shards] == [6, 6, 6, 6]
+    ids = [case.case_id for shard in shards for case in shard]
+    assert sorted(ids) == [f"C{number:05d}" for number in range(24)]
+    assert [case.case_id for case in shards[1]] == ["C00001", "C00005", "C00009", "C00013", "C00017", "C00021"]
+
+
+def test_generator_is_lazy():
+    first = list(itertools.islice(generate_checkout_cases(), 3))
+    assert [case.case_id for case in first] == ["C00000", "C00001", "C00002"]
+
+
+def test_cases_file_is_sharded_like_the_generator(tmp_path):
+    path = tmp_path / "cases.jsonl"
+    path.write_text("".join(
+        json.dumps({"case_id": f"F{n}", "items": ["Sauce Labs Backpack"], "firstname": "a", "lastname": "b",
+                    "postalcode": "1"}) + "\n"
+        for n in range(5)
+    ))
+    assert [case.case_id for case in get_checkout_cases(0, 2, cases_file=str(path))] == ["F0", "F2", "F4"]
+
+
+def test_error_priority_matches_the_site():
+    assert expected_error("", "", "") == "Error: First Name is required"
+    assert expected_error("a", "", "") == "Error: Last Name is required"
+    assert expected_error("a", "b", "") == "Error: Postal Code is required"
+    assert expected_error("a", "b", "c") is None
+
+
+def test_error_case_has_no_expected_totals():
+    case = build_case(7, (product(9.99),), "", "John", "123")
+    assert case.expected_error == "Error: First Name is required"
+    assert (case.expected_subtotal, case.expected_tax, case.expected_total) == (None, None, None)
+
+
+def test_tax_and_total_are_rounded_to_cents():
+    case = build_case(0, (product(29.99), product(9.99)), "a", "b", "c")
+    assert (case.expected_subtotal, case.expected_tax, case.expected_total) == (39.98, 3.20, 43.18)
+    #subtotal of float prices is rounded before the tax (0.1 + 0.2 = 0.30000000000000004)
+    case = build_case(0, (product(0.1), product(0.2)), "a", "b", "c")
+    assert (case.expected_subtotal, case.expected_tax, case.expected_total) == (0.3, 0.02, 0.32)
+
+
+def test_totals_of_the_full_catalog():
+    case = build_case(1, get_products(), "a", "b", "c")
+    assert case.expected_subtotal == 129.94
+    assert case.expected_tax == 10.40
+    assert case.expected_total == 140.34
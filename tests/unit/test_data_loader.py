@@ -0,0 +1,83 @@
+"""Schema validation of the data files (no browser)"""
+import json
+
+import pytest
+
+from utils.data_loader import CheckoutCase, LoginCase, UserDataRepository, get_products, iter_records, to_record
+
+
+def write_users(path, **overrides):
+    data = {
+        "positive_cases": [{"username": "standard_user", "password": "secret_sauce", "expected_url_part": "inventory.html"}],
+        "negative_cases": [{"username": "locked_out_user", "password": "secret_sauce", "expected_error": "locked out"}],
+        "checkout_data": [{"firstname": "Tester", "lastname": "John", "postalcode": "123456", "tax_value": 0.08}],
+    }
+    data.update(overrides)
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_repository_builds_typed_records(tmp_path):
+    repository = UserDataRepository(write_users(tmp_path / "users.json"))
+    assert repository.default_user == LoginCase("standard_user", "secret_sauce", expected_url_part="inventory.html")
+    assert repository.negative_logins[0].expected_error == "locked out"
+    assert repository.checkout_data[0].tax_value == 0.08
+
+
+def test_repository_rejects_missing_section(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps({"positive_cases": []}))
+    with pytest.raises(ValueError, match="missing section"):
+        UserDataRepository(str(path))
+
+
+def test_repository_needs_a_positive_user(tmp_path):
+    with pytest.raises(ValueError, match="at least one valid user"):
+        UserDataRepository(write_users(tmp_path / "users.json", positive_cases=[]))
+
+
+@pytest.mark.parametrize("values, message", [
+    ({"username": "a", "password": "b"}, "missing 'expected_url_part'"),
+    ({"username": "a", "password": 1, "expected_url_part": "x"}, "'password' must be"),
+    ({"username": "a", "password": "b", "expected_url_part": "x", "role": "admin"}, "unknown field"),
+])
+def test_to_record_rejects_invalid_values(values, message):
+    with pytest.raises(ValueError, match=message):
+        to_record("positive_cases", values)
+
+
+def test_products_file_is_valid():
+    products = get_products()
+    assert len(products) == 6
+    assert len({product.id for product in products}) == len(products)
+
+
+def test_iter_records_reads_jsonl_and_csv(tmp_path):
+    case = {"case_id": "C00001", "items": ["Sauce Labs Backpack", "Sauce Labs Bike Light"],
+            "firstname": "Tester", "lastname": "John", "postalcode": "123456",
+            "expected_subtotal": 39.98, "expected_tax": 3.2, "expected_total": 43.18}
+    jsonl = tmp_path / "cases.jsonl"
+    jsonl.write_text(json.dumps(case) + "\n\n")
+    csv = tmp_path / "cases.csv"
+    csv.write_text(
+        "case_id,items,firstname,lastname,postalcode,expected_error,expected_subtotal,expected_tax,expected_total\n"
+        "C00001,Sauce Labs Backpack|Sauce Labs Bike Light,Tester,John,123456,,39.98,3.2,43.18\n"
+    )
+
+    expected = CheckoutCase(**dict(case, items=tuple(case["items"])))
+    assert list(iter_records(str(jsonl), "checkout_cases")) == [expected]
+    assert list(iter_records(str(csv), "checkout_cases")) == [expected]
+
+
+def test_iter_records_reports_the_bad_line(tmp_path):
+    path = tmp_path / "cases.jsonl"
+    path.write_text(json.dumps({"case_id": "C1", "items": [], "firstname": "a", "lastname": "b"}) + "\n")
+    with pytest.raises(ValueError, match=r"cases.jsonl:1: missing 'postalcode'"):
+        list(iter_records(str(path), "checkout_cases"))
+
+
+def test_iter_records_rejects_unknown_format(tmp_path):
+    path = tmp_path / "cases.xml"
+    path.write_text("")
+    with pytest.raises(ValueError, match="Unsupported dataset format"):
+        list(iter_records(str(path), "checkout_cases"))
@@ -0,0 +1,126 @@
+"""Log rotation, retention, offset index and the query CLI (no browser)"""
+import gzip
+import logging
+import os
+import time
+
+import pytest
+
+from utils import log_query
+from utils.log_store import INDEX_FILE, IndexedRotatingFileHandler, connect_index, read_slice
+
+
+@pytest.fixture(autouse=True)
+def run_id(monkeypatch):
+    monkeypatch.setenv("TEST_RUN_ID", "20260101-120000")
+
+
+def make_handler(folder, **settings):
+    handler = IndexedRotatingFileHandler(os.path.join(folder, "automation_test.log"), "events", **settings)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def emit(handler, message, test_id, name="pages"):
+    record = logging.LogRecord(name, logging.INFO, __file__, 0, message, None, None)
+    record.test_id = test_id
+    handler.emit(record)
+
+
+def end_test(handler, test_id, outcome):
+    record = logging.LogRecord("events", logging.INFO, __file__, 0, "test end", None, None)
+    record.test_id = test_id
+    record.action = "test_end"
+    record.outcome = outcome
+    handler.emit(record)
+
+
+def segments(folder):
+    index = connect_index(str(folder))
+    try:
+        return index.execute("SELECT test_id, file, start, end, outcome FROM segments ORDER BY rowid").fetchall()
+    finally:
+        index.close()
+
+
+def test_index_points_to_the_lines_of_each_test(tmp_path):
+    handler = make_handler(str(tmp_path))
+    emit(handler, "login ok", "test_a")
+    emit(handler, "cart ok", "test_a")
+    end_test(handler, "test_a", "passed")
+    emit(handler, "checkout broken", "test_b")
+    end_test(handler, "test_b", "failed")
+    handler.close()
+
+    rows = segments(tmp_path)
+    assert [(test, outcome) for test, _, _, _, outcome in rows] == [("test_a", "passed"), ("test_b", "failed")]
+    assert read_slice(str(tmp_path), rows[0][1], rows[0][2], rows[0][3]) == b"login ok\ncart ok\n"
+    assert read_slice(str(tmp_path), rows[1][1], rows[1][2], rows[1][3]) == b"checkout broken\n"
+
+
+def test_rotation_archives_gzip_and_splits_the_test(tmp_path):
+    handler = make_handler(str(tmp_path), max_bytes=20)
+    emit(handler, "first line of the test", "test_a")
+    emit(handler, "second line", "test_a")
+    end_test(handler, "test_a", "passed")
+    handler.close()
+
+    archives = [name for name in os.listdir(tmp_path) if name.endswith(".gz")]
+    assert len(archives) == 1
+    with gzip.open(tmp_path / archives[0], "rb") as f:
+        assert f.read() == b"first line of the test\n"
+
+    rows = segments(tmp_path)
+    assert [row[1] for row in rows] == [archives[0], "automation_test.log"]
+    text = b"".join(read_slice(str(tmp_path), file, start, end) for _, file, start, end, _ in rows)
+    assert text == b"first line of the test\nsecond line\n"
+
+
+def test_backups_limit_removes_archives_and_their_rows(tmp_path):
+    handler = make_handler(str(tmp_path), max_bytes=1, backups=2)
+    for number in range(5):
+        emit(handler, f"line {number}", f"test_{number}")
+        end_test(handler, f"test_{number}", "passed")
+    handler.close()
+
+    archives = sorted(name for name in os.listdir(tmp_path) if name.endswith(".gz"))
+    assert len(archives) == 2
+    assert {row[1] for row in segments(tmp_path)} <= set(archives) | {"automation_test.log"}
+
+
+def test_retention_removes_old_archives(tmp_path):
+    old = tmp_path / "automation_test.log.20200101-000000-000000.gz"
+    with gzip.open(old, "wb") as f:
+        f.write(b"old run\n")
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(old, (two_days_ago, two_days_ago))
+
+    handler = make_handler(str(tmp_path), retention_days=1)
+    handler.remove_old_archives()
+    handler.close()
+    assert not old.exists()
+
+
+def test_query_cli_shows_the_log_of_one_test(tmp_path, capsys):
+    handler = make_handler(str(tmp_path))
+    emit(handler, "all good", "tests.test_cart.TestCart.test_01_access")
+    end_test(handler, "tests.test_cart.TestCart.test_01_access", "passed")
+    emit(handler, "badge mismatch", "tests.test_cart.TestCart.test_07_remove")
+    end_test(handler, "tests.test_cart.TestCart.test_07_remove", "failed")
+    handler.close()
+
+    assert log_query.main(["--logs", str(tmp_path), "show", "test_07_remove"]) == 0
+    assert capsys.readouterr().out == "badge mismatch\n"
+
+    assert log_query.main(["--logs", str(tmp_path), "list", "--failed"]) == 0
+    listing = capsys.readouterr().out
+    assert "test_07_remove" in listing and "test_01_access" not in listing
+
+    assert log_query.main(["--logs", str(tmp_path), "runs"]) == 0
+    assert "20260101-120000" in capsys.readouterr().out
+
+
+def test_query_cli_without_index(tmp_path, capsys):
+    assert not os.path.exists(tmp_path / INDEX_FILE)
+    assert log_query.main(["--logs", str(tmp_path), "runs"]) == 1
+    assert "No log index" in capsys.readouterr().err
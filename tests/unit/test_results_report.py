@@ -0,0 +1,89 @@
+"""Results store (JSONL) and the HTML report rendered from it (no browser)"""
+import json
+import os
+
+from utils.html_report import PROJECT_ROOT, render_report
+from utils.results_store import ResultsStore, read_results, summarize_results, write_summary
+
+
+def result(nodeid, outcome, duration=1.0, phases=None, **extra):
+    return dict({"nodeid": nodeid, "outcome": outcome, "duration": duration, "worker": "gw0", "phases": phases}, **extra)
+
+
+def phases(setup, call, teardown, outcome="passed"):
+    return {"test": "t", "outcome": outcome, "setup": setup, "call": call, "teardown": teardown,
+            "total": setup + call + teardown}
+
+
+def write_store(path, results):
+    store = ResultsStore(str(path))
+    for item in results:
+        store.add(item)
+    store.close()
+    return str(path)
+
+
+def test_store_appends_one_line_per_result(tmp_path):
+    path = write_store(tmp_path / "results" / "run.jsonl", [result("a", "passed"), result("b", "failed")])
+    write_store(tmp_path / "results" / "run.jsonl", [result("c", "error")])
+    assert [r["nodeid"] for r in read_results(path)] == ["a", "b", "c"]
+
+
+def test_half_written_last_line_is_skipped(tmp_path):
+    path = write_store(tmp_path / "run.jsonl", [result("a", "passed")])
+    with open(path, "a") as f:
+        f.write('{"nodeid": "b", "outc')
+    assert [r["nodeid"] for r in read_results(path)] == ["a"]
+
+
+def test_summary_counts_outcomes_workers_and_phases(tmp_path):
+    results = [
+        result("a", "passed", 2.0, phases(1.0, 0.5, 0.5)),
+        result("b", "failed", 3.0, phases(1.0, 1.5, 0.5, "failed"), worker="gw1"),
+        result("c", "skipped", 0.0),
+    ]
+    summary = summarize_results(results)
+    assert summary["summary"] == {"passed": 1, "failed": 1, "skipped": 1}
+    assert summary["workers"] == ["gw0", "gw1"]
+    assert summary["total_duration"] == 5.0
+    assert [r["total"] for r in summary["phase_timings"]["tests"]] == [3.0, 2.0]
+    assert summary["phase_timings"]["summary"]["setup"] == {"total": 2.0, "share": 0.4}
+
+    path = write_store(tmp_path / "run.jsonl", results)
+    written = write_summary(path, str(tmp_path / "Report_Summary.json"))
+    with open(tmp_path / "Report_Summary.json") as f:
+        assert json.load(f)["summary"] == written["summary"]
+
+
+def test_report_has_one_row_per_result_and_escapes_text(tmp_path):
+    path = write_store(tmp_path / "run.jsonl", [
+        result("tests/test_cart.py::TestCart::test_01", "passed", 1.5, phases(1.0, 0.25, 0.25)),
+        result("tests/test_cart.py::TestCart::test_07", "failed", 2.0, longrepr="AssertionError: <b>1 != 0</b>"),
+    ])
+    output = tmp_path / "report" / "report.html"
+    summary = render_report(path, str(output))
+    html = output.read_text(encoding="utf-8")
+
+    assert summary["summary"] == {"passed": 1, "failed": 1}
+    assert html.count('<tr data-outcome="passed">') == 1
+    assert html.count('<tr data-outcome="failed">') == 2  #result row + details row
+    assert "&lt;b&gt;1 != 0&lt;/b&gt;" in html and "<b>1 != 0</b>" not in html
+    assert '<td class="num">0.25</td>' in html
+
+
+def test_report_links_artifacts_instead_of_embedding_them(tmp_path):
+    folder = os.path.relpath(tmp_path / "artifacts" / "test_07", PROJECT_ROOT)
+    os.makedirs(os.path.join(PROJECT_ROOT, folder))
+    screenshot = os.path.relpath(tmp_path / "screenshots" / "abc.png", PROJECT_ROOT)
+    with open(os.path.join(PROJECT_ROOT, folder, "meta.json"), "w") as f:
+        json.dump({"url": "https://www.saucedemo.com/cart.html", "screenshot": screenshot}, f)
+
+    path = write_store(tmp_path / "run.jsonl", [result("test_07", "error", artifacts=folder)])
+    output = tmp_path / "report.html"
+    render_report(path, str(output))
+    html = output.read_text(encoding="utf-8")
+
+    assert "URL: https://www.saucedemo.com/cart.html" in html
+    assert '<img loading="lazy" src="screenshots/abc.png"' in html
+    assert 'href="artifacts/test_07/meta.json"' in html
+    assert "base64" not in html
@@ -0,0 +1,160 @@
+"""
+Failure artifacts (screenshot, DOM, browser console, URL) without blocking tearDown.
+
+The test thread only asks the browser for the raw data (base64 screenshot, page source,
+console entries, URL) and puts it on a queue. ONE writer thread per process decodes,
+hashes, compresses and writes the files:
+
+- screenshots/<sha256>.png                   : named by content, the same picture is stored once
+- artifacts/<worker>/<test>_<time>_<n>/      : dom.html.gz, console.json, meta.json (url, screenshot, test id)
+"""
+import atexit
+import base64
+import gzip
+import hashlib
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+from utils.workers import get_worker_id
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCREENSHOT_FOLDER = os.path.join(PROJECT_ROOT, "screenshots")
+ARTIFACT_FOLDER = os.path.join(PROJECT_ROOT, "artifacts")
+
+logger = logging.getLogger(__name__)
+
+_sequence = itertools.count(1)
+
+
+def artifact_name(test_name):
+    #microseconds + worker + counter: unique across workers and fast consecutive failures
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    return f"{test_name}_{stamp}_{get_worker_id()}_{next(_sequence)}"
+
+
+def write_atomic(path, data):
+    """Write to a temp file then rename, readers (and other workers) never see half a file"""
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def project_path(path):
+    #paths in meta.json are relative to the project (report links), others stay absolute
+    path = os.path.abspath(path)
+    if path.startswith(PROJECT_ROOT + os.sep):
+        return os.path.relpath(path, PROJECT_ROOT)
+    return path
+
+
+def grab_failure_state(driver):
+    """Raw data from the browser, nothing is decoded or written here (runs in the test thread)"""
+    state = {}
+    grabs = {
+        "url": lambda: driver.current_url,
+        "screenshot": driver.get_screenshot_as_base64,
+        "dom": lambda: driver.page_source,
+        #needs goog:loggingPrefs browser=ALL (utils/driver_pool.py)
+        "console": lambda: driver.get_log("browser"),
+    }
+    for key, grab in grabs.items():
+        try:
+            state[key] = grab()
+        except (WebDriverException, AttributeError, ValueError) as e:
+            state[key] = None
+            state.setdefault("errors", {})[key] = f"{e.__class__.__name__}: {str(e).strip()[:200]}"
+    return state
+
+
+class ArtifactWriter:
+    def __init__(self, screenshot_folder=SCREENSHOT_FOLDER, artifact_folder=ARTIFACT_FOLDER):
+        self.screenshot_folder = screenshot_folder
+        self.artifact_folder = artifact_folder
+        self.queue = queue.Queue()
+        self.known_hashes = set()
+        self.duplicates = 0
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, test_id, test_name, state):
+        """Queue the state for writing. RETURN: artifact folder (filled in the background)"""
+        folder = os.path.join(self.artifact_folder, get_worker_id(), artifact_name(test_name))
+        self.queue.put((folder, test_id, state))
+        return folder
+
+    def flush(self):
+        """Wait until everything queued is written"""
+        self.queue.join()
+
+    #WRITER THREAD
+    def _run(self):
+        while True:
+            folder, test_id, state = self.queue.get()
+            try:
+                self._write(folder, test_id, state)
+            except Exception:
+                logger.exception("Artifacts of %s not written", test_id)
+            finally:
+                self.queue.task_done()
+
+    def _write(self, folder, test_id, state):
+        os.makedirs(folder, exist_ok=True)
+        meta = {
+            "test": test_id,
+            "worker": get_worker_id(),
+            "url": state.get("url"),
+            "screenshot": None,
+            "screenshot_sha256": None,
+            "errors": state.get("errors", {}),
+        }
+        if state.get("screenshot"):
+            meta["screenshot_sha256"], meta["screenshot"] = self._write_screenshot(state["screenshot"])
+        if state.get("dom") is not None:
+            write_atomic(os.path.join(folder, "dom.html.gz"), gzip.compress(state["dom"].encode("utf-8"), 6))
+        if state.get("console") is not None:
+            write_atomic(os.path.join(folder, "console.json"), json.dumps(state["console"], indent=2).encode("utf-8"))
+        write_atomic(os.path.join(folder, "meta.json"), json.dumps(meta, indent=2).encode("utf-8"))
+        logger.info("Artifacts of %s written to %s (screenshot %s)", test_id, folder, meta["screenshot"])
+
+    def _write_screenshot(self, encoded):
+        png = base64.b64decode(encoded)
+        digest = hashlib.sha256(png).hexdigest()
+        path = os.path.join(self.screenshot_folder, f"{digest}.png")
+        if digest in self.known_hashes or os.path.exists(path):
+            self.duplicates += 1
+        else:
+            os.makedirs(self.screenshot_folder, exist_ok=True)
+            write_atomic(path, png)
+        self.known_hashes.add(digest)
+        return digest, project_path(path)
+
+
+_writer = None
+_lock = threading.Lock()
+
+
+def get_artifact_writer():
+    """Writer of this process (thread started on first use)"""
+    global _writer
+    with _lock:
+        if _writer is None:
+            _writer = ArtifactWriter()
+    return _writer
+
+
+def capture_failure(driver, test_id, test_name):
+    """Grab the failure state now, write it in the background. RETURN: artifact folder (project relative)"""
+    return project_path(get_artifact_writer().submit(test_id, test_name, grab_failure_state(driver)))
+
+
+def flush_artifacts():
+    """Wait for the artifacts still queued in this process (nothing to do when no test failed)"""
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,51 @@
+import json
+import logging
+from utils.config import get_base_url
+from utils.data_loader import get_products
+
+logger = logging.getLogger(__name__)
+
+# saucedemo keeps the cart on the client: localStorage["cart-contents"] = "[4,0,1]" (product ids)
+CART_STORAGE_KEY = "cart-contents"
+
+
+def resolve_product_ids(items):
+    """Product names or ids -> list of product ids (unknown item = ValueError)"""
+    products = get_products()
+    by_name = {p.name: p.id for p in products}
+    known_ids = {p.id for p in products}
+
+    ids = []
+    for item in items:
+        product_id = item if isinstance(item, int) else by_name.get(item)
+        if product_id not in known_ids:
+            raise ValueError(f"Unknown product {item!r}, expected one of {sorted(by_name)}")
+        if product_id not in ids:
+            ids.append(product_id)
+    return ids
+
+
+def seed_cart(driver, items, page=None):
+    """
+    Set the cart to exactly `items` (names or ids) without clicking in the inventory UI.
+    The driver must already be on the site (logged in). The cart state is written in one
+    script call, then the page is loaded once: a refresh, a path (e.g. "cart.html") or a page
+    object. A page object is opened with page.open(), which also waits until the page is ready
+    (pages load with the "eager" strategy, the cart is not rendered yet when driver.get returns).
+    """
+    ids = resolve_product_ids(items)
+    #empty cart = no key at all (same as the site after removing the last item)
+    driver.execute_script(
+        "if (arguments[1] === null) { window.localStorage.removeItem(arguments[0]); }"
+        " else { window.localStorage.setItem(arguments[0], arguments[1]); }",
+        CART_STORAGE_KEY,
+        json.dumps(ids, separators=(",", ":")) if ids else None,
+    )
+    if page is None:
+        driver.refresh()
+    elif isinstance(page, str):
+        driver.get(get_base_url() + page)
+    else:
+        page.open()
+    logger.info("Cart seeded with product ids %s", ids)
+    return ids
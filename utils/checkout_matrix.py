@@ -0,0 +1,95 @@
+import itertools
+import os
+from decimal import ROUND_HALF_UP, Decimal
+from utils.data_loader import CheckoutCase, get_products, iter_records
+
+TAX_RATE = 0.08 #saucedemo tax on the overview page
+
+# Name / postal code edge cases. The list lengths (8 and 5) and the 63 item subsets
+# are coprime, so case N walks every combination once before repeating (63 * 8 * 5 = 2520)
+NAME_CASES = [
+    ("Tester", "John"),
+    ("O'Brien", "D'Angelo"),
+    ("Ñandú", "Müller"),
+    ("李", "小龙"),
+    ("A" * 50, "B" * 50),
+    ("Anne-Marie", "van der Berg"),
+    ("", "John"),
+    ("Tester", ""),
+]
+POSTAL_CASES = ["123456", "A1B 2C3", "12345-6789", "00000", ""]
+
+
+def item_subsets(products):
+    """Every non-empty combination of products (1 item, 2 items, ... all items)"""
+    return [
+        subset
+        for size in range(1, len(products) + 1)
+        for subset in itertools.combinations(products, size)
+    ]
+
+
+def expected_error(firstname, lastname, postalcode):
+    #same priority as the site: first name, last name, postal code
+    if not firstname:
+        return "Error: First Name is required"
+    if not lastname:
+        return "Error: Last Name is required"
+    if not postalcode:
+        return "Error: Postal Code is required"
+    return None
+
+
+def build_case(number, subset, firstname, lastname, postalcode):
+    error = expected_error(firstname, lastname, postalcode)
+    subtotal = round(sum(p.price for p in subset), 2)
+    tax = float((Decimal(str(subtotal)) * Decimal(str(TAX_RATE))).quantize(Decimal("0.01"), ROUND_HALF_UP))
+    return CheckoutCase(
+        case_id=f"C{number:05d}",
+        items=tuple(p.name for p in subset),
+        firstname=firstname,
+        lastname=lastname,
+        postalcode=postalcode,
+        expected_error=error,
+        expected_subtotal=None if error else subtotal,
+        expected_tax=None if error else tax,
+        expected_total=None if error else round(subtotal + tax, 2),
+    )
+
+
+def generate_checkout_cases(products=None):
+    """
+    Lazy generator of checkout combinations (nothing is built before it is needed).
+    Case N uses subset N % 63, names N % 8 and postal code N % 5.
+    """
+    subsets = item_subsets(products or get_products())
+    total = len(subsets) * len(NAME_CASES) * len(POSTAL_CASES)
+    for number in range(total):
+        firstname, lastname = NAME_CASES[number % len(NAME_CASES)]
+        yield build_case(number, subsets[number % len(subsets)], firstname, lastname, POSTAL_CASES[number % len(POSTAL_CASES)])
+
+
+def get_checkout_cases(shard_index, shard_count, limit=None, cases_file=None):
+    """
+    Cases of ONE shard: every shard_count-th case starting at shard_index.
+    - limit      : max number of cases for the whole matrix (before sharding)
+    - cases_file : stream cases from a .jsonl/.csv file instead of the generator
+    """
+    cases = iter_records(cases_file, "checkout_cases") if cases_file else generate_checkout_cases()
+    if limit:
+        cases = itertools.islice(cases, limit)
+    return itertools.islice(cases, shard_index, None, shard_count)
+
+
+def get_matrix_settings():
+    """
+    MATRIX_LIMIT  : cases in the run (default 24, 0 = all 2520)
+    MATRIX_SHARDS : number of shards = test classes shared out to workers (default 4)
+                    (must be the same in every process, xdist compares the collected tests)
+    MATRIX_FILE   : optional .jsonl/.csv dataset instead of the generator
+    """
+    return {
+        "limit": int(os.environ.get("MATRIX_LIMIT", 24)),
+        "shards": int(os.environ.get("MATRIX_SHARDS", 4)),
+        "cases_file": os.environ.get("MATRIX_FILE") or None,
+    }
@@ -0,0 +1,74 @@
+import json
+import os
+from utils.local_server import start_local_server
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENVIRONMENTS_FILE = os.path.join(PROJECT_ROOT, "config", "environments.json")
+DEFAULT_ENVIRONMENT = "production"
+
+# base_url value that means "start the bundled local stand-in server"
+LOCAL_BASE_URL = "local"
+
+
+class EnvironmentProfile:
+    """One entry of config/environments.json (base URL, timeouts/polling, browser flags, resource profile, data file)"""
+
+    def __init__(self, name, values):
+        self.name = name
+        self.base_url = values["base_url"]
+        self.timeout = values["timeout"]
+        self.short_timeout = values["short_timeout"]
+        self.poll_interval = values.get("poll_interval", 0.5)
+        self.headless = values["headless"]
+        self.window_size = values["window_size"]
+        self.browser_args = values.get("browser_args", [])
+        self.resource_profile = values.get("resource_profile", "lean")
+        #"eager": driver.get returns at DOMContentLoaded, page objects wait for their own READY_LOCATOR
+        self.page_load_strategy = values.get("page_load_strategy", "eager")
+        self.data_file = os.path.join(PROJECT_ROOT, values["data_file"])
+
+    def __repr__(self):
+        return f"EnvironmentProfile({self.name!r}, base_url={self.base_url!r})"
+
+
+_profile = None
+_local_server = None
+
+
+def load_profile(name):
+    with open(ENVIRONMENTS_FILE) as f:
+        environments = json.load(f)
+    if name not in environments:
+        raise ValueError(f"Unknown environment '{name}'. Available: {', '.join(environments)}")
+    return EnvironmentProfile(name, environments[name])
+
+
+def get_profile():
+    """
+    Active environment profile (loaded once per process).
+    Selected with TEST_ENV=<name> or `pytest --env <name>`.
+    LOCAL_SITE=1 is a shortcut for TEST_ENV=local.
+    """
+    global _profile
+    if _profile is None:
+        name = os.environ.get("TEST_ENV", DEFAULT_ENVIRONMENT)
+        if os.environ.get("LOCAL_SITE") == "1":
+            name = "local"
+        _profile = load_profile(name)
+    return _profile
+
+
+def get_base_url():
+    """
+    Base URL used by all page objects.
+    - BASE_URL=... overrides the profile (any other deployment)
+    - profile base_url "local" -> local stand-in server (started once per process)
+    """
+    global _local_server
+    base_url = os.environ.get("BASE_URL", get_profile().base_url)
+    if base_url == LOCAL_BASE_URL:
+        if _local_server is None:
+            _local_server = start_local_server()
+        return _local_server[1]
+
+    return base_url if base_url.endswith("/") else base_url + "/"
@@ -0,0 +1,170 @@
+import csv
+import json
+import os
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from typing import Optional
+from utils.config import get_profile
+
+
+# ---------- TYPED RECORDS ----------
+# (dataclass, not tuple: ddt keeps the short test names test_01_positive_login_1, ...)
+@dataclass(frozen=True)
+class LoginCase:
+    username: str
+    password: str
+    expected_url_part: Optional[str] = None
+    expected_error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CheckoutData:
+    firstname: str
+    lastname: str
+    postalcode: str
+    tax_value: float
+
+
+@dataclass(frozen=True)
+class CheckoutCase:
+    """One generated checkout combination (see utils/checkout_matrix.py)"""
+    case_id: str
+    items: tuple
+    firstname: str
+    lastname: str
+    postalcode: str
+    expected_error: Optional[str] = None
+    expected_subtotal: Optional[float] = None
+    expected_tax: Optional[float] = None
+    expected_total: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    description: str
+    price: float
+    image: str
+
+
+# Schema: section in users.json -> (record type, required keys with their type)
+SCHEMA = {
+    "positive_cases": (LoginCase, {"username": str, "password": str, "expected_url_part": str}),
+    "negative_cases": (LoginCase, {"username": str, "password": str, "expected_error": str}),
+    "checkout_data": (CheckoutData, {"firstname": str, "lastname": str, "postalcode": str, "tax_value": (int, float)}),
+}
+
+# Records that live in their own (possibly huge) dataset files, streamed with iter_records()
+DATASET_SCHEMA = dict(SCHEMA, **{
+    "checkout_cases": (CheckoutCase, {"case_id": str, "items": (list, tuple), "firstname": str, "lastname": str, "postalcode": str}),
+    "products": (Product, {"id": int, "name": str, "description": str, "price": (int, float), "image": str}),
+})
+
+PRODUCTS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "products.json")
+
+
+def to_record(section, values, source="record"):
+    """Validate one raw dictionary against DATASET_SCHEMA[section] and build its typed record"""
+    record_type, required = DATASET_SCHEMA[section]
+    for key, expected_type in required.items():
+        if key not in values:
+            raise ValueError(f"{source}: missing '{key}'")
+        if not isinstance(values[key], expected_type):
+            raise ValueError(f"{source}: '{key}' must be {expected_type}, got {type(values[key]).__name__}")
+    unknown = set(values) - {field.name for field in fields(record_type)}
+    if unknown:
+        raise ValueError(f"{source}: unknown field(s) {sorted(unknown)}")
+    if "items" in values:
+        values = dict(values, items=tuple(values["items"])) #hashable like the rest of the record
+    return record_type(**values)
+
+
+class UserDataRepository:
+    """Parsed and validated content of data/users.json (loaded once per process)"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "r") as f:
+            raw = json.load(f)
+
+        missing = set(SCHEMA) - set(raw)
+        if missing:
+            raise ValueError(f"{path}: missing section(s) {sorted(missing)}")
+
+        records = {
+            section: [to_record(section, values, f"{path}: {section}[{i}]") for i, values in enumerate(raw[section])]
+            for section in SCHEMA
+        }
+        self.positive_logins = records["positive_cases"]
+        self.negative_logins = records["negative_cases"]
+        self.checkout_data = records["checkout_data"]
+
+        if not self.positive_logins:
+            raise ValueError(f"{path}: positive_cases needs at least one valid user")
+
+    @property
+    def default_user(self):
+        """User used by BaseTestLoggedIn (first positive case)"""
+        return self.positive_logins[0]
+
+
+@lru_cache(maxsize=None)
+def _load_repository(path):
+    return UserDataRepository(path)
+
+
+def get_test_data(path=None):
+    """Repository for the profile data file (or `path`), parsed once per process"""
+    return _load_repository(os.path.abspath(path or get_profile().data_file))
+
+
+@lru_cache(maxsize=None)
+def get_products(path=PRODUCTS_FILE):
+    """Product catalog (data/products.json), same data as the local stand-in site"""
+    with open(path, "r") as f:
+        return tuple(to_record("products", values, f"{path}[{i}]") for i, values in enumerate(json.load(f)))
+
+
+def iter_records(path, section):
+    """
+    Stream typed records from a large generated dataset, one line at a time.
+    - .jsonl : one JSON object per line
+    - .csv   : header row with the field names
+    Nothing is loaded in memory up front (safe for millions of rows).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    record_type = DATASET_SCHEMA[section][0]
+    #empty CSV cell on a field with a default value = field not set
+    optional = {field.name for field in fields(record_type) if field.default is not MISSING}
+
+    with open(path, "r", newline="") as f:
+        if extension == ".jsonl":
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield to_record(section, json.loads(line), f"{path}:{line_number}")
+        elif extension == ".csv":
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                values = {
+                    key: _convert_csv(key, value) for key, value in row.items()
+                    if not (value == "" and key in optional)
+                }
+                yield to_record(section, values, f"{path}:{line_number}")
+        else:
+            raise ValueError(f"Unsupported dataset format '{extension}' (use .jsonl or .csv)")
+
+
+# CSV values are all strings: fields converted when reading .csv datasets
+CSV_FLOAT_FIELDS = {"tax_value", "price", "expected_subtotal", "expected_tax", "expected_total"}
+CSV_INT_FIELDS = {"id"}
+CSV_LIST_FIELDS = {"items"} #"item a|item b"
+
+
+def _convert_csv(key, value):
+    if key in CSV_FLOAT_FIELDS:
+        return float(value)
+    if key in CSV_INT_FIELDS:
+        return int(value)
+    if key in CSV_LIST_FIELDS:
+        return value.split("|")
+    return value
@@ -0,0 +1,167 @@
+import atexit
+import logging
+import os
+import threading
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from utils.config import get_profile
+from utils.profiler import get_profiler
+from utils.resource_profiles import apply_resource_profile
+
+logger = logging.getLogger(__name__)
+
+
+def build_chrome_options():
+    """Chrome options shared by every browser in the pool (flags from the environment profile)"""
+    profile = get_profile()
+    options = webdriver.ChromeOptions()
+
+    # Shutdown "Save Password" and "Password Leak Detection"
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "safebrowsing.enabled": False, # Turn Off safebrowsing
+        "profile.default_content_setting_values.notifications": 2, # Blokir notifikasi
+        "profile.password_manager_leak_detection": False,
+    }
+    options.add_experimental_option("prefs", prefs)
+    options.page_load_strategy = profile.page_load_strategy
+    # Browser console is read for the failure artifacts (utils/artifacts.py)
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+
+    # Argument for turning off other features that interrupt automation
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-popup-blocking")
+    if profile.headless:
+        options.add_argument("--headless")
+    options.add_argument(f"--window-size={profile.window_size}")
+    options.add_argument("--disable-save-password-bubble")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-features=PasswordLeakDetection")
+    for argument in profile.browser_args:
+        options.add_argument(argument)
+    return options
+
+
+def create_chrome_driver():
+    """Launch a new headless Chrome (the slow part we want to do rarely)"""
+    driver = webdriver.Chrome(options=build_chrome_options())
+    profiler = get_profiler()
+    if profiler:
+        profiler.instrument(driver)
+    driver.maximize_window()
+    return driver
+
+
+class DriverPool:
+    """
+    Pool of warmed WebDriver instances for ONE worker process.
+    - acquire(): hand out an idle driver that still answers, or launch a new one (with the test's resource profile)
+    - release(): reset the driver state and put it back for the next test
+    A driver is recycled (quit) after `max_uses` tests, when it crashed,
+    or when the pool already holds `size` idle drivers.
+    """
+
+    def __init__(self, size=1, max_uses=25, factory=create_chrome_driver):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, resource_profile=None):
+        """Idle or new driver; resource_profile = which assets the browser loads (utils/resource_profiles.py)"""
+        driver = None
+        while driver is None:
+            with self._lock:
+                if not self._idle:
+                    break
+                driver = self._idle.pop()
+            if not self.is_alive(driver):
+                logger.warning("DriverPool: idle browser does not answer anymore, recycling it")
+                self._discard(driver)
+                driver = None
+
+        if driver is None:
+            driver = self.factory()
+            self._uses[id(driver)] = 0
+            logger.info("DriverPool: launched new browser (session %s)", driver.session_id)
+        if resource_profile:
+            apply_resource_profile(driver, resource_profile)
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return driver to the pool. Set broken=True to force recycle"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if broken or uses >= self.max_uses or not self.reset(driver):
+            self._discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def is_alive(self, driver):
+        """One cheap command to check the session before a test gets it (browser may have crashed while idle)"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def reset(self, driver):
+        """
+        Clean browser state between tests (windows, cookies, storage, URL)
+        RETURN: False if the browser is not usable anymore (crash)
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass #about:blank / data: pages have no storage
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.warning("DriverPool: browser reset failed, recycling it (%s)", e.__class__.__name__)
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def shutdown(self):
+        with self._lock:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self._discard(driver)
+
+
+_pool = None
+
+
+def get_driver_pool():
+    """Return the pool of this process (created on first call)"""
+    global _pool
+    if _pool is None:
+        _pool = DriverPool(
+            size=int(os.environ.get("DRIVER_POOL_SIZE", 1)),
+            max_uses=int(os.environ.get("DRIVER_MAX_USES", 25)),
+        )
+        atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,122 @@
+import logging
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
+# WebDriver commands that load another document -> every cached element is outdated.
+# A click can navigate too (continue, finish, item title, ...) or re-render the page,
+# the URL is not asked after every click (one more round trip), the cache is just emptied.
+NAVIGATION_COMMANDS = {Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH, Command.CLICK_ELEMENT}
+
+
+class ElementCacheStats:
+    """Hit / miss / re-locate counters of all element caches of this process"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.relocations = 0
+        self.invalidations = 0
+
+    def snapshot(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "relocations": self.relocations,
+            "invalidations": self.invalidations,
+        }
+
+
+_stats = ElementCacheStats()
+
+
+def get_element_cache_stats():
+    """Return the element cache counters of this process"""
+    return _stats
+
+
+def track_navigation(driver):
+    """
+    Count navigation commands and clicks on the driver (wraps driver.execute once, like the profiler).
+    Caches compare this counter instead of asking the browser for its URL on every hit.
+    """
+    if hasattr(driver, "navigation_count"):
+        return driver
+    original_execute = driver.execute
+    driver.navigation_count = 0
+
+    def counted_execute(driver_command, params=None):
+        if driver_command in NAVIGATION_COMMANDS:
+            driver.navigation_count += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = counted_execute
+    return driver
+
+
+class CachedElement(WebElement):
+    """
+    WebElement that knows its locator: when a command fails with
+    StaleElementReferenceException it is located again with the finder of the first lookup
+    (a wait, the next page may not be rendered yet) and the command is retried once.
+    """
+
+    def __init__(self, element, locator, relocate):
+        super().__init__(element.parent, element.id)
+        self.locator = locator
+        self._relocate = relocate
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            _stats.relocations += 1
+            logger.debug("ElementCache: %s stale, locating again", self.locator)
+            self._id = self._relocate(self.locator).id
+            return super()._execute(command, params)
+
+
+class ElementCache:
+    """
+    Located elements of one page object, keyed by locator.
+    Repeated access in the same page state costs no round trip; the cache is emptied
+    when the driver navigates (get/back/forward/refresh), after any click, or when the page object calls clear().
+    """
+
+    def __init__(self, driver, wait):
+        self.driver = track_navigation(driver)
+        self.wait = wait
+        self._elements = {}
+        self._navigation = driver.navigation_count
+
+    def get(self, locator, finder=None):
+        """
+        Cached element for locator. On a miss it is found with finder(locator)
+        (default: wait for presence, e.g. pass a wait for visibility)
+        """
+        if self._navigation != self.driver.navigation_count:
+            self.clear()
+        element = self._elements.get(locator)
+        if element is not None:
+            _stats.hits += 1
+            return element
+
+        _stats.misses += 1
+        finder = finder or self._find
+        element = self._elements[locator] = CachedElement(finder(locator), locator, finder)
+        return element
+
+    def invalidate(self, locator):
+        self._elements.pop(locator, None)
+
+    def clear(self):
+        if self._elements:
+            _stats.invalidations += 1
+        self._elements.clear()
+        self._navigation = self.driver.navigation_count
+
+    def _find(self, locator):
+        return self.wait.until(EC.presence_of_element_located(locator))
@@ -0,0 +1,128 @@
+"""
+One HTML report for the whole run, rendered from the results store (utils/results_store.py).
+
+- rows are written to the file while the JSONL store is read (no big string in memory)
+- CSS/JS once per report, screenshots are <img loading="lazy"> links to screenshots/<sha256>.png
+  (not base64 inside the HTML), so the report stays small for big parallel runs
+
+    python -m utils.html_report Report_Test/results/20260101-120000.jsonl -o Report_Test/report.html
+"""
+import argparse
+import html
+import json
+import os
+from utils.results_store import read_results, summarize_results
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STYLE = """
+body { font-family: Arial, sans-serif; margin: 20px; color: #222; }
+table { border-collapse: collapse; width: 100%; font-size: 13px; }
+th, td { border-bottom: 1px solid #ddd; padding: 6px; text-align: left; vertical-align: top; }
+.passed { color: #2e7d32; } .failed, .error { color: #c62828; } .skipped { color: #9e6a03; }
+.num { text-align: right; font-family: monospace; }
+pre { white-space: pre-wrap; background: #f6f8fa; padding: 8px; max-height: 400px; overflow: auto; }
+img { max-width: 480px; border: 1px solid #ccc; }
+.filters button { margin-right: 6px; }
+.hidden { display: none; }
+"""
+
+SCRIPT = """
+function showOnly(outcome) {
+  document.querySelectorAll("tbody tr").forEach(function (row) {
+    row.classList.toggle("hidden", outcome !== "all" && row.dataset.outcome !== outcome);
+  });
+}
+"""
+
+FAILED = ("failed", "error")
+
+
+def _relative(path, report_folder):
+    #links in the report are relative, the folder can be zipped / uploaded as it is
+    return os.path.relpath(os.path.join(PROJECT_ROOT, path), report_folder).replace(os.sep, "/")
+
+
+def _read_meta(folder):
+    try:
+        with open(os.path.join(PROJECT_ROOT, folder, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def render_artifacts(folder, report_folder):
+    meta = _read_meta(folder)
+    if meta is None:
+        return f"<p>Artifacts: {html.escape(folder)}</p>"
+    parts = [f"<p>URL: {html.escape(str(meta.get('url')))}</p>"]
+    links = [f'<a href="{_relative(os.path.join(folder, name), report_folder)}">{name}</a>'
+             for name in ("dom.html.gz", "console.json", "meta.json")
+             if os.path.exists(os.path.join(PROJECT_ROOT, folder, name))]
+    parts.append("<p>" + " | ".join(links) + "</p>")
+    if meta.get("screenshot"):
+        src = _relative(meta["screenshot"], report_folder)
+        parts.append(f'<a href="{src}"><img loading="lazy" src="{src}" alt="screenshot"></a>')
+    return "".join(parts)
+
+
+def render_row(result, report_folder):
+    outcome = result["outcome"]
+    phases = result.get("phases") or {}
+    cells = [
+        f'<td class="{outcome}">{outcome}</td>',
+        f"<td>{html.escape(result['nodeid'])}</td>",
+        f"<td>{html.escape(str(result.get('worker', '')))}</td>",
+    ]
+    for key in ("setup", "call", "teardown"):
+        value = phases.get(key)
+        cells.append(f'<td class="num">{"" if value is None else f"{value:.2f}"}</td>')
+    cells.append(f'<td class="num">{result["duration"]:.2f}</td>')
+    row = f'<tr data-outcome="{outcome}">{"".join(cells)}</tr>\n'
+
+    if outcome in FAILED:
+        details = []
+        if result.get("longrepr"):
+            details.append(f"<pre>{html.escape(result['longrepr'])}</pre>")
+        if result.get("artifacts"):
+            details.append(render_artifacts(result["artifacts"], report_folder))
+        row += f'<tr data-outcome="{outcome}"><td></td><td colspan="6">{"".join(details)}</td></tr>\n'
+    return row
+
+
+def render_report(results_path, output_path, title="SauceDemo Automation Report"):
+    """Write the HTML report of a results store file. RETURN: summary dictionary"""
+    report_folder = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(report_folder, exist_ok=True)
+    summary = summarize_results(read_results(results_path))
+    counts = ", ".join(f'<span class="{o}">{n} {o}</span>' for o, n in sorted(summary["summary"].items()))
+    phases = ", ".join(
+        f"{'body' if phase == 'call' else phase} {s['total']:.1f}s ({s['share']:.0%})"
+        for phase, s in summary["phase_timings"]["summary"].items()
+    )
+    buttons = "".join(
+        f'<button onclick="showOnly(\'{o}\')">{o}</button>' for o in ["all"] + sorted(summary["summary"])
+    )
+
+    with open(output_path, "w", encoding="utf-8") as out:
+        out.write(f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>")
+        out.write(f"<style>{STYLE}</style><script>{SCRIPT}</script></head><body>\n")
+        out.write(f"<h1>{html.escape(title)}</h1>\n")
+        out.write(f"<p>{summary['generated_at']} | workers: {', '.join(summary['workers']) or '-'} | "
+                  f"{counts} | {summary['total_duration']:.1f}s</p>\n")
+        out.write(f"<p>Phases: {phases}</p>\n<p class=\"filters\">{buttons}</p>\n")
+        out.write("<table><thead><tr><th>Outcome</th><th>Test</th><th>Worker</th><th>Setup (s)</th>"
+                  "<th>Body (s)</th><th>Teardown (s)</th><th>Duration (s)</th></tr></thead><tbody>\n")
+        for result in read_results(results_path):
+            out.write(render_row(result, report_folder))
+        out.write("</tbody></table></body></html>\n")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the HTML report of a results file")
+    parser.add_argument("results", help="Report_Test/results/<run>.jsonl")
+    parser.add_argument("-o", "--output", default=os.path.join(PROJECT_ROOT, "Report_Test", "report.html"))
+    args = parser.parse_args()
+    render_report(args.results, args.output)
+    print(f"Report saved on {args.output}")
@@ -0,0 +1,56 @@
+import argparse
+import functools
+import json
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITE_FOLDER = os.path.join(PROJECT_ROOT, "local_site")
+PRODUCTS_FILE = os.path.join(PROJECT_ROOT, "data", "products.json")
+
+
+class LocalSiteHandler(SimpleHTTPRequestHandler):
+    """Serve local_site/ and build static/products.js from data/products.json"""
+
+    def do_GET(self):
+        if self.path.split("?")[0] == "/static/products.js":
+            with open(PRODUCTS_FILE) as f:
+                body = f"window.SAUCE_PRODUCTS = {json.dumps(json.load(f))};".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/javascript")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass #keep test output clean
+
+
+def start_local_server(host="127.0.0.1", port=0):
+    """
+    Start the SauceDemo stand-in in a background thread.
+    port=0 -> pick a free port (every worker process gets its own server)
+    RETURN: (server, base_url)
+    """
+    handler = functools.partial(LocalSiteHandler, directory=SITE_FOLDER)
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, name="local-saucedemo", daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the local SauceDemo stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server, base_url = start_local_server(args.host, args.port)
+    print(f"Local SauceDemo running on {base_url} (CTRL+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,176 @@
+"""
+Non-blocking logging for the test run (one pipeline per process / xdist worker).
+
+Loggers only put records on a queue (QueueHandler on the root logger); ONE writer thread
+(QueueListener) formats and writes them. Messages are formatted in the writer thread,
+so `logger.info("x=%s", value)` costs almost nothing in the test.
+
+Files per worker (logs/):
+- automation_test[_gw0].log   : human readable lines (same format as before)
+- automation_test[_gw0].jsonl : one JSON event per record (test id, page, action, duration, outcome)
+Both are rotated to .gz archives and indexed per test (utils/log_store.py, utils/log_query.py).
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from utils.log_store import IndexedRotatingFileHandler
+from utils.workers import get_worker_id, worker_file_name
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOG_FOLDER = os.path.join(PROJECT_ROOT, "logs")
+TEXT_FORMAT = "%(asctime)s - %(levelname)s = %(message)s"
+
+# our own loggers (tests use the class name, utils/pages use the module name)
+EVENT_LOGGER = "events"
+PROJECT_LOGGERS = ("utils", "pages", EVENT_LOGGER)
+
+# structured fields copied from `extra=` into the JSON event
+EVENT_FIELDS = ("page", "action", "duration", "outcome")
+
+
+def get_rotation_settings():
+    """
+    LOG_MAX_BYTES      : archive the live file above this size (default 5 MB)
+    LOG_MAX_AGE_HOURS  : ...or when it is older than this (default 24)
+    LOG_BACKUPS        : archives kept per file (default 30)
+    LOG_RETENTION_DAYS : archives older than this are deleted (default 90)
+    """
+    return {
+        "max_bytes": int(os.environ.get("LOG_MAX_BYTES", 5_000_000)),
+        "max_age": float(os.environ.get("LOG_MAX_AGE_HOURS", 24)) * 3600,
+        "backups": int(os.environ.get("LOG_BACKUPS", 30)),
+        "retention_days": float(os.environ.get("LOG_RETENTION_DAYS", 90)),
+    }
+
+
+class LogContext:
+    """Test currently running in this process (added to every record)"""
+    test_id = None
+
+
+def set_test_context(test_id):
+    LogContext.test_id = test_id
+
+
+class ContextFilter(logging.Filter):
+    def filter(self, record):
+        record.test_id = LogContext.test_id
+        record.worker = get_worker_id()
+        return True
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler.prepare() formats the message in the calling thread.
+    Here the record is only copied: msg % args is done later by the writer thread.
+    """
+
+    def prepare(self, record):
+        return copy.copy(record)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        event = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": getattr(record, "worker", None),
+            "test": getattr(record, "test_id", None),
+            "message": record.getMessage(),
+        }
+        for field in EVENT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                event[field] = value
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str)
+
+
+class NotEventFilter(logging.Filter):
+    """Keep structured events (page/action) out of the human log and console"""
+
+    def filter(self, record):
+        return record.name != EVENT_LOGGER
+
+
+class LogPipeline:
+    def __init__(self, log_folder=LOG_FOLDER):
+        os.makedirs(log_folder, exist_ok=True)
+        self.queue = queue.SimpleQueue()
+        self.handler = LazyQueueHandler(self.queue)
+        self.handler.addFilter(ContextFilter())
+
+        rotation = get_rotation_settings()
+        text_formatter = logging.Formatter(TEXT_FORMAT)
+        #the text file gets the events too: test_end closes the index row of the test
+        text_file = IndexedRotatingFileHandler(
+            os.path.join(log_folder, worker_file_name("automation_test", ".log")), EVENT_LOGGER, **rotation
+        )
+        text_file.setFormatter(text_formatter)
+        console = logging.StreamHandler()
+        console.setFormatter(text_formatter)
+        console.addFilter(NotEventFilter())
+
+        json_file = IndexedRotatingFileHandler(
+            os.path.join(log_folder, worker_file_name("automation_test", ".jsonl")), EVENT_LOGGER,
+            write_events=True, **rotation
+        )
+        json_file.setFormatter(JsonFormatter())
+
+        self.listener = logging.handlers.QueueListener(
+            self.queue, text_file, console, json_file, respect_handler_level=True
+        )
+
+    def start(self):
+        root = logging.getLogger()
+        root.addHandler(self.handler)
+        for name in PROJECT_LOGGERS:
+            logging.getLogger(name).setLevel(logging.INFO)
+        self.listener.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        """Flush everything still in the queue and close the files"""
+        logging.getLogger().removeHandler(self.handler)
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+
+
+_pipeline = None
+_lock = threading.Lock()
+
+
+def setup_logging():
+    """Start the logging pipeline of this process (only the first call does something)"""
+    global _pipeline
+    with _lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline().start()
+    return _pipeline
+
+
+_event_logger = logging.getLogger(EVENT_LOGGER)
+
+
+def log_event(action, page=None, duration=None, outcome=None):
+    """Structured event (JSON log only), e.g. log_event("get_page_title", "sauceDemoCartPage", 0.12, "ok")"""
+    if _event_logger.isEnabledFor(logging.INFO):
+        _event_logger.info(
+            "%s %s", page or "-", action,
+            extra={
+                "page": page,
+                "action": action,
+                "duration": None if duration is None else round(duration, 4),
+                "outcome": outcome,
+            },
+        )
@@ -0,0 +1,124 @@
+"""
+Read the log of one test from the index (logs/log_index.sqlite), live or archived files.
+
+    python -m utils.log_query runs                         # last runs with passed / failed counts
+    python -m utils.log_query list --run latest --failed   # tests of a run
+    python -m utils.log_query show test_07_remove          # log lines of the test (latest run)
+    python -m utils.log_query show test_07 --run 20260101-120000 --json
+"""
+import argparse
+import os
+import sys
+
+from utils.log_pipeline import LOG_FOLDER
+from utils.log_store import INDEX_FILE, connect_index, read_slice
+
+
+def latest_run(index):
+    row = index.execute("SELECT run_id FROM segments ORDER BY started_at DESC LIMIT 1").fetchone()
+    return row[0] if row else None
+
+
+def resolve_run(index, run):
+    return latest_run(index) if run == "latest" else run
+
+
+def list_runs(index, limit=20):
+    """(run_id, started, tests, failed) of the last runs, newest first"""
+    return index.execute(
+        """
+        SELECT run_id, MIN(started_at), COUNT(DISTINCT test_id),
+               COUNT(DISTINCT CASE WHEN outcome IN ('failed', 'error') THEN test_id END)
+        FROM segments WHERE live_file NOT LIKE '%.jsonl'
+        GROUP BY run_id ORDER BY MIN(started_at) DESC LIMIT ?
+        """,
+        (limit,),
+    ).fetchall()
+
+
+def list_tests(index, run, failed_only=False):
+    """(test_id, worker, outcome, bytes) of one run"""
+    query = """
+        SELECT test_id, worker, MAX(outcome), SUM(end - start)
+        FROM segments WHERE run_id = ? AND live_file NOT LIKE '%.jsonl'
+        GROUP BY test_id, worker
+    """
+    if failed_only:
+        query += " HAVING MAX(outcome) IN ('failed', 'error')"
+    return index.execute(query + " ORDER BY MIN(started_at)", (run,)).fetchall()
+
+
+def find_segments(index, test, run=None, json_log=False):
+    """Index rows (file, start, end, run_id, test_id) of the tests matching `test` (substring of the id)"""
+    query = "SELECT file, start, end, run_id, test_id FROM segments WHERE test_id LIKE ? AND live_file LIKE ?"
+    params = [f"%{test}%", "%.jsonl" if json_log else "%.log"]
+    if run:
+        query += " AND run_id = ?"
+        params.append(run)
+    return index.execute(query + " ORDER BY started_at, rowid", params).fetchall()
+
+
+def get_test_log(test, run="latest", json_log=False, log_folder=LOG_FOLDER):
+    """Log text of the matching test(s), only the indexed byte ranges are read"""
+    index = connect_index(log_folder)
+    try:
+        chunks = []
+        for file_name, start, end, _, _ in find_segments(index, test, resolve_run(index, run), json_log):
+            try:
+                chunks.append(read_slice(log_folder, file_name, start, end))
+            except FileNotFoundError:
+                chunks.append(f"[{file_name} was deleted by the retention]\n".encode())
+        return b"".join(chunks).decode("utf-8", errors="replace")
+    finally:
+        index.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the indexed test logs")
+    parser.add_argument("--logs", default=LOG_FOLDER, help="log folder (default logs/)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="last runs")
+    runs.add_argument("--limit", type=int, default=20)
+
+    tests = commands.add_parser("list", help="tests of a run")
+    tests.add_argument("--run", default="latest")
+    tests.add_argument("--failed", action="store_true", help="only failed / error tests")
+
+    show = commands.add_parser("show", help="log of one test")
+    show.add_argument("test", help="test id or part of it, e.g. test_07_remove")
+    show.add_argument("--run", default="latest", help="run id, 'latest' or 'all'")
+    show.add_argument("--json", action="store_true", help="JSON events instead of the text log")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.logs, INDEX_FILE)):
+        print(f"No log index in {args.logs}", file=sys.stderr)
+        return 1
+
+    if args.command == "show":
+        run = None if args.run == "all" else args.run
+        text = get_test_log(args.test, run, args.json, args.logs)
+        if not text:
+            print(f"No log for '{args.test}' (run {args.run})", file=sys.stderr)
+            return 1
+        sys.stdout.write(text)
+        return 0
+
+    index = connect_index(args.logs)
+    try:
+        if args.command == "runs":
+            print(f"{'run':<20} {'tests':>6} {'failed':>6}")
+            for run_id, _, count, failed in list_runs(index, args.limit):
+                print(f"{run_id:<20} {count:>6} {failed:>6}")
+        else:
+            run = resolve_run(index, args.run)
+            print(f"run {run}")
+            for test_id, worker, outcome, size in list_tests(index, run, args.failed):
+                print(f"  {outcome or '-':<7} {worker:<7} {size:>8} B  {test_id}")
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Text log storage: rotation, compressed archives, retention and a per-test index.
+
+- the live file (logs/automation_test[_gw0].log) is archived when it is bigger than
+  LOG_MAX_BYTES or older than LOG_MAX_AGE_HOURS -> automation_test_gw0.log.20260101-120000-000000.gz
+- archives are kept LOG_BACKUPS per file and at most LOG_RETENTION_DAYS days
+- logs/log_index.sqlite stores for every test: run, worker, file, byte offsets, outcome,
+  so `python -m utils.log_query show <test>` reads only that slice (see utils/log_query.py)
+Same for the .jsonl event files.
+"""
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime
+from utils.workers import get_worker_id
+
+INDEX_FILE = "log_index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    run_id     TEXT,
+    worker     TEXT,
+    test_id    TEXT,
+    file       TEXT,
+    live_file  TEXT,
+    start      INTEGER,
+    end        INTEGER,
+    started_at REAL,
+    outcome    TEXT
+);
+CREATE INDEX IF NOT EXISTS segments_test ON segments (test_id);
+CREATE INDEX IF NOT EXISTS segments_run ON segments (run_id);
+"""
+
+
+def get_run_id():
+    """Same for the controller and every xdist worker (set by tests/conftest.py)"""
+    return os.environ.get("TEST_RUN_ID") or datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def connect_index(log_folder):
+    #one index for all workers: sqlite locks, writers wait up to 10s
+    connection = sqlite3.connect(os.path.join(log_folder, INDEX_FILE), timeout=10, check_same_thread=False)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def read_slice(log_folder, file_name, start, end):
+    """Bytes [start, end) of a live or archived (.gz) log file"""
+    path = os.path.join(log_folder, file_name)
+    opener = gzip.open if file_name.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+class IndexedRotatingFileHandler(logging.FileHandler):
+    """
+    FileHandler of the writer thread (utils/log_pipeline.py) that rotates/compresses the file
+    and writes one index row per test (and per file, when a test spans a rotation).
+    The "test_end" event closes the row of the test with its outcome; events are
+    only written to the file with write_events=True (JSON log).
+    """
+
+    def __init__(self, path, event_logger, write_events=False,
+                 max_bytes=5_000_000, max_age=24 * 3600, backups=30, retention_days=90):
+        self.log_folder = os.path.dirname(path)
+        self.live_file = os.path.basename(path)
+        self.event_logger = event_logger
+        self.write_events = write_events
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self.retention_days = retention_days
+        self.run_id = get_run_id()
+        self.index = connect_index(self.log_folder)
+        self._index_lock = threading.Lock()
+        self._segment = None  # (test_id, start offset, started_at)
+        super().__init__(path, mode="a", encoding="utf-8")
+        self._opened_at = self._live_file_started() or time.time()
+
+    #WRITING
+    def emit(self, record):
+        try:
+            is_event = record.name == self.event_logger
+            if is_event and not self.write_events:
+                self._end_test(record)
+                return
+            if self.stream is None:
+                self.stream = self._open()
+            if self.should_rollover():
+                self.do_rollover()
+
+            test_id = getattr(record, "test_id", None)
+            if self._segment is None or self._segment[0] != test_id:
+                self._close_segment()
+                if test_id is not None:
+                    self._segment = (test_id, self.stream.tell(), record.created)
+            super().emit(record)
+            if is_event:
+                self._end_test(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self._close_segment()
+            super().close()
+            with self._index_lock:
+                self.index.close()
+        finally:
+            self.release()
+
+    #INDEX
+    def _end_test(self, record):
+        if getattr(record, "action", None) == "test_end":
+            self._close_segment(getattr(record, "outcome", None))
+
+    def _close_segment(self, outcome=None):
+        if self._segment is None or self.stream is None:
+            self._segment = None
+            return
+        test_id, start, started_at = self._segment
+        self._segment = None
+        end = self.stream.tell()
+        with self._index_lock:
+            self.index.execute(
+                "INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, get_worker_id(), test_id, self.live_file, self.live_file, start, end, started_at, outcome),
+            )
+            self.index.commit()
+
+    def _live_file_started(self):
+        with self._index_lock:
+            row = self.index.execute(
+                "SELECT MIN(started_at) FROM segments WHERE file = ?", (self.live_file,)
+            ).fetchone()
+        return row[0]
+
+    #ROTATION
+    def should_rollover(self):
+        if self.stream.tell() == 0:
+            return False
+        return self.stream.tell() >= self.max_bytes or time.time() - self._opened_at >= self.max_age
+
+    def do_rollover(self):
+        #a test split by the rotation gets one index row per file
+        segment = self._segment
+        self._close_segment()
+        self.stream.close()
+        self.stream = None
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        archive = f"{self.live_file}.{stamp}.gz"
+        counter = 1
+        while os.path.exists(os.path.join(self.log_folder, archive)):
+            archive = f"{self.live_file}.{stamp}-{counter}.gz"
+            counter += 1
+        with open(self.baseFilename, "rb") as source, gzip.open(os.path.join(self.log_folder, archive), "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(self.baseFilename)
+
+        with self._index_lock:
+            self.index.execute("UPDATE segments SET file = ? WHERE file = ?", (archive, self.live_file))
+            self.index.commit()
+        self.remove_old_archives()
+
+        self.stream = self._open()
+        self._opened_at = time.time()
+        if segment is not None:
+            self._segment = (segment[0], 0, segment[2])
+
+    def remove_old_archives(self):
+        """Keep the newest `backups` archives of this file, none older than `retention_days`"""
+        archives = sorted(glob.glob(os.path.join(self.log_folder, f"{glob.escape(self.live_file)}.*.gz")), reverse=True)
+        limit = time.time() - self.retention_days * 86400
+        for index, path in enumerate(archives):
+            if index >= self.backups or os.path.getmtime(path) < limit:
+                os.remove(path)
+                with self._index_lock:
+                    self.index.execute("DELETE FROM segments WHERE file = ?", (os.path.basename(path),))
+                    self.index.commit()
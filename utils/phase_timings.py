@@ -0,0 +1,63 @@
+"""
+Outcome and setUp / test body / tearDown duration of every test (recorded by tests/base_test.py).
+tests/conftest.py attaches them to the pytest report, the results store keeps them and the
+table of the slowest tests is printed at the end of the run.
+"""
+import unittest
+
+PHASES = ("setup", "call", "teardown")
+
+
+def outcome_of(exception, failure_exception=AssertionError):
+    """passed / failed / error / skipped for an exception raised by a test phase"""
+    if isinstance(exception, unittest.SkipTest):
+        return "skipped"
+    if isinstance(exception, failure_exception):
+        return "failed"
+    return "error"
+
+
+class PhaseTimings:
+    def __init__(self):
+        self.records = []
+
+    def record(self, test_id, outcome, timings, artifacts=None):
+        record = {"test": test_id, "outcome": outcome, "artifacts": artifacts}
+        for phase in PHASES:
+            record[phase] = round(timings.get(phase, 0.0), 4)
+        record["total"] = round(sum(record[phase] for phase in PHASES), 4)
+        self.records.append(record)
+        return record
+
+
+_timings = PhaseTimings()
+
+
+def get_phase_timings():
+    """Phase timings of the tests run by this process"""
+    return _timings
+
+
+def summarize(records):
+    """Total seconds and share of the run per phase"""
+    totals = {phase: round(sum(r[phase] for r in records), 3) for phase in PHASES}
+    grand_total = sum(totals.values())
+    return {
+        phase: {"total": totals[phase], "share": round(totals[phase] / grand_total, 3) if grand_total else 0.0}
+        for phase in PHASES
+    }
+
+
+def format_timing_table(records, top=15):
+    """Slowest tests with their setup / body / teardown split, plus the share of each phase"""
+    lines = [f"{'TEST':<70} {'OUTCOME':<8} {'SETUP(s)':>9} {'BODY(s)':>9} {'TEARDOWN(s)':>12} {'TOTAL(s)':>9}"]
+    for r in sorted(records, key=lambda r: r["total"], reverse=True)[:top]:
+        lines.append(
+            f"{r['test'][-70:]:<70} {str(r['outcome']):<8} {r['setup']:>9.3f} {r['call']:>9.3f} {r['teardown']:>12.3f} {r['total']:>9.3f}"
+        )
+    summary = summarize(records)
+    lines.append("")
+    lines.append(f"{len(records)} tests: " + ", ".join(
+        f"{'body' if phase == 'call' else phase} {s['total']:.2f}s ({s['share']:.0%})" for phase, s in summary.items()
+    ))
+    return "\n".join(lines)
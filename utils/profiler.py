@@ -0,0 +1,169 @@
+import argparse
+import atexit
+import json
+import logging
+import os
+import sys
+import time
+from utils.waits import get_wait_telemetry
+from utils.workers import get_worker_id, worker_file_name
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_FOLDER = os.path.join(PROJECT_ROOT, "pages") + os.sep
+TESTS_FOLDER = os.path.join(PROJECT_ROOT, "tests") + os.sep
+PROFILE_FOLDER = os.path.join(PROJECT_ROOT, "logs")
+
+
+class CommandProfiler:
+    """
+    Records every WebDriver command (= one HTTP round trip to chromedriver) with:
+    command name, locator (find commands), page object method, test name and duration.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.current_test = None
+
+    def instrument(self, driver):
+        """Wrap driver.execute (WebElement commands go through it too)"""
+        original_execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = timed_execute
+        return driver
+
+    def record(self, command, params, duration):
+        locator = None
+        if params and "using" in params and "value" in params:
+            locator = f"{params['using']}={params['value']}"
+        self.records.append({
+            "command": command,
+            "locator": locator,
+            "caller": _find_caller(),
+            "test": self.current_test,
+            "duration": duration,
+        })
+
+    def build_profile(self, top=15):
+        """RETURN: dictionary with the hot paths of this process"""
+        profile = {
+            "worker": get_worker_id(),
+            "total_commands": len(self.records),
+            "total_time": round(sum(r["duration"] for r in self.records), 3),
+            "tests": _group(self.records, "test"),
+            "page_methods": _group(self.records, "caller", top),
+            "slow_locators": _group([r for r in self.records if r["locator"]], "locator", top),
+            "commands": _group(self.records, "command", top),
+            "wait_timeouts": {
+                label: stats for label, stats in get_wait_telemetry().summary().items() if stats["timeouts"]
+            },
+        }
+        return profile
+
+    def write(self, folder=PROFILE_FOLDER):
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, worker_file_name("webdriver_profile", ".json"))
+        profile = self.build_profile()
+        with open(path, "w") as f:
+            json.dump(profile, f, indent=2)
+        #same summary as plain text table, next to the JSON file
+        with open(path[:-len(".json")] + ".txt", "w") as f:
+            f.write(format_summary(profile) + "\n")
+        logger.info("WebDriver profile saved on %s", path)
+        return path
+
+
+def _find_caller():
+    """First page object method on the stack (fallback: test method)"""
+    frame = sys._getframe(2)
+    test_caller = None
+    while frame is not None:
+        file_name = frame.f_code.co_filename
+        if file_name.startswith(PAGES_FOLDER):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            return f"{owner.__class__.__name__}.{name}" if owner is not None else name
+        if test_caller is None and file_name.startswith(TESTS_FOLDER):
+            test_caller = f"tests:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return test_caller or "other"
+
+
+def _group(records, key, top=None):
+    stats = {}
+    for r in records:
+        s = stats.setdefault(str(r[key]), {"count": 0, "total": 0.0, "max": 0.0})
+        s["count"] += 1
+        s["total"] += r["duration"]
+        s["max"] = max(s["max"], r["duration"])
+    for s in stats.values():
+        s["total"] = round(s["total"], 4)
+        s["max"] = round(s["max"], 4)
+    ordered = sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True)
+    return dict(ordered[:top] if top else ordered)
+
+
+def format_summary(profile, top=10):
+    """Plain text table of the hottest page methods / locators / tests"""
+    lines = [f"WebDriver commands: {profile['total_commands']} in {profile['total_time']}s"]
+    for title, key in (("PAGE METHOD", "page_methods"), ("LOCATOR", "slow_locators"), ("TEST (round trips)", "tests")):
+        lines.append("")
+        lines.append(f"{title:<70} {'CALLS':>7} {'TOTAL(s)':>9} {'MAX(s)':>8}")
+        for name, s in list(profile[key].items())[:top]:
+            lines.append(f"{name[:70]:<70} {s['count']:>7} {s['total']:>9.3f} {s['max']:>8.3f}")
+    if profile["wait_timeouts"]:
+        lines.append("")
+        lines.append("WAITS THAT HIT TIMEOUT")
+        for label, s in profile["wait_timeouts"].items():
+            lines.append(f"{label[:70]:<70} {s['timeouts']:>7} {s['total']:>9.3f}")
+    return "\n".join(lines)
+
+
+def merge_profiles(paths):
+    """Combine the per-worker profile files into one summary"""
+    merged = {"worker": "all", "total_commands": 0, "total_time": 0.0, "tests": {}, "page_methods": {},
+              "slow_locators": {}, "commands": {}, "wait_timeouts": {}}
+    for path in paths:
+        with open(path) as f:
+            profile = json.load(f)
+        merged["total_commands"] += profile["total_commands"]
+        merged["total_time"] = round(merged["total_time"] + profile["total_time"], 3)
+        for key in ("tests", "page_methods", "slow_locators", "commands", "wait_timeouts"):
+            for name, s in profile[key].items():
+                target = merged[key].setdefault(name, {k: 0 for k in s})
+                for k, v in s.items():
+                    target[k] = max(target[k], v) if k == "max" else target[k] + v
+    for key in ("tests", "page_methods", "slow_locators", "commands"):
+        merged[key] = dict(sorted(merged[key].items(), key=lambda item: item[1]["total"], reverse=True))
+    return merged
+
+
+_profiler = None
+
+
+def get_profiler():
+    """
+    Profiler of this process, or None when disabled.
+    Enable with PROFILE_COMMANDS=1 (profile is written to logs/ when the process exits)
+    """
+    global _profiler
+    if _profiler is None and os.environ.get("PROFILE_COMMANDS") == "1":
+        _profiler = CommandProfiler()
+        atexit.register(_profiler.write)
+    return _profiler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the summary of WebDriver profile files")
+    parser.add_argument("files", nargs="+", help="logs/webdriver_profile*.json")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    print(format_summary(merge_profiles(args.files), args.top))
@@ -0,0 +1,66 @@
+import logging
+import os
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico"]
+FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+THIRD_PARTY = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*backtrace.io*",
+    "*optimizely.com*",
+    "*hotjar.com*",
+]
+
+# Blocked URL patterns per profile (Chrome DevTools Network.setBlockedURLs, * = wildcard)
+RESOURCE_PROFILES = {
+    "full": [],
+    "no-images": IMAGES,
+    "no-third-party": THIRD_PARTY + FONTS,
+    "lean": IMAGES + THIRD_PARTY + FONTS,
+}
+
+
+def resource_profile(name):
+    """
+    Test method decorator: load the page assets this test needs.
+    Tests without it get the environment default (lean = no images, fonts or analytics).
+
+        @resource_profile("full")
+        def test_7_validate_item_content(self): ...
+    """
+    if name not in RESOURCE_PROFILES:
+        raise ValueError(f"Unknown resource profile '{name}'. Available: {', '.join(RESOURCE_PROFILES)}")
+
+    def decorator(test_method):
+        test_method.resource_profile = name
+        return test_method
+    return decorator
+
+
+def get_resource_profile(test_method, default):
+    """RESOURCE_PROFILE=... (force for every test) > @resource_profile on the test > default"""
+    name = os.environ.get("RESOURCE_PROFILE") or getattr(test_method, "resource_profile", None) or default
+    if name not in RESOURCE_PROFILES:
+        raise ValueError(f"Unknown resource profile '{name}'. Available: {', '.join(RESOURCE_PROFILES)}")
+    return name
+
+
+def apply_resource_profile(driver, name):
+    """
+    Block the URLs of profile `name` in this browser via CDP (kept until changed).
+    Nothing is sent when the browser already has this profile.
+    """
+    if getattr(driver, "resource_profile", None) == name:
+        return
+    try:
+        if getattr(driver, "resource_profile", None) is None:
+            driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": RESOURCE_PROFILES[name]})
+        driver.resource_profile = name
+    except (AttributeError, WebDriverException) as e:
+        #not a Chromium driver (no CDP): everything is loaded, like "full"
+        logger.warning("Resource profile '%s' not applied (%s)", name, e.__class__.__name__)
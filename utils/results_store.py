@@ -0,0 +1,67 @@
+"""
+Run results as JSON lines, written by ONE process (pytest main process / xdist controller)
+as soon as each test finishes: a crashed or cancelled run still has its results.
+
+    Report_Test/results/<TEST_RUN_ID>.jsonl   : one line per test (outcome, durations, phase timings, artifacts)
+    Report_Test/Report_Summary.json           : counts + phase timing summary (see summarize_results)
+"""
+import json
+import os
+from datetime import datetime
+from utils.phase_timings import summarize
+
+
+class ResultsStore:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def add(self, result):
+        #one line per result, flushed: readers see every finished test
+        self._file.write(json.dumps(result, default=str) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def read_results(path):
+    """Results of a store file one by one (skips a half-written last line)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def summarize_results(results):
+    """Counts per outcome, workers, total duration and the phase timing summary"""
+    summary = {}
+    workers = set()
+    timings = []
+    total_duration = 0.0
+    for result in results:
+        summary[result["outcome"]] = summary.get(result["outcome"], 0) + 1
+        workers.add(result.get("worker"))
+        total_duration += result["duration"]
+        if result.get("phases"):
+            timings.append(result["phases"])
+    timings.sort(key=lambda r: r["total"], reverse=True)
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "workers": sorted(w for w in workers if w),
+        "summary": summary,
+        "total_duration": round(total_duration, 3),
+        "phase_timings": {"summary": summarize(timings), "tests": timings},
+    }
+
+
+def write_summary(results_path, output_path):
+    """Report_Summary.json from a store file. RETURN: summary dictionary"""
+    summary = summarize_results(read_results(results_path))
+    summary["results_file"] = results_path
+    with open(output_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
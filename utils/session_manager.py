@@ -0,0 +1,70 @@
+import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from pages.inventory_page import sauceDemoInventoryPage
+from pages.login_page import sauceDemoLoginPage
+from utils.config import get_base_url, get_profile
+from utils.state_snapshot import capture_state, is_expired, restore_state
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    Authenticated sessions captured once per user per worker process.
+    First call for a user logs in through the UI and saves cookies + localStorage,
+    next calls inject that state (utils/state_snapshot.py) into the (pooled) driver and open inventory directly.
+    """
+
+    LANDING_PAGE = "inventory.html"
+
+    def __init__(self):
+        self._sessions = {}
+
+    def login(self, driver, username, password):
+        session = self._sessions.get(username)
+        if session and not is_expired(session):
+            if self.inject(driver, session):
+                return
+            logger.warning("SessionCache: injected session for %s rejected, UI login again", username)
+
+        self._sessions[username] = self._login_and_capture(driver, username, password)
+
+    def inject(self, driver, session):
+        """
+        Put saved cookies/storage into driver and land on inventory page.
+        RETURN: False when the app rejected the session: redirected, or the inventory never got
+        ready (with the "eager" load strategy a rejection can come after driver.get returns)
+        """
+        if not restore_state(driver, session, get_base_url() + self.LANDING_PAGE):
+            return False
+        try:
+            self._wait_for_landing_page(driver)
+        except TimeoutException:
+            return False
+        return True
+
+    def _wait_for_landing_page(self, driver):
+        WebDriverWait(driver, get_profile().timeout).until(
+            EC.presence_of_element_located(sauceDemoInventoryPage.READY_LOCATOR)
+        )
+
+    def _login_and_capture(self, driver, username, password):
+        login_page = sauceDemoLoginPage(driver)
+        login_page.open_page()
+        login_page.enter_username(username)
+        login_page.enter_password(password)
+        login_page.click_loginbtn()
+        WebDriverWait(driver, get_profile().timeout).until(EC.url_contains(self.LANDING_PAGE))
+        self._wait_for_landing_page(driver) #tests start on a ready inventory page
+
+        return capture_state(driver)
+
+
+_session_cache = SessionCache()
+
+
+def get_session_cache():
+    """Return the session cache of this process"""
+    return _session_cache
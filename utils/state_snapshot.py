@@ -0,0 +1,105 @@
+import logging
+import time
+from selenium.common.exceptions import TimeoutException
+from utils.config import get_base_url
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_SCRIPT = """
+return {
+    url: window.location.href,
+    local_storage: Object.assign({}, window.localStorage),
+    session_storage: Object.assign({}, window.sessionStorage)
+};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+window.localStorage.clear();
+window.sessionStorage.clear();
+for (const [k, v] of Object.entries(arguments[0])) { window.localStorage.setItem(k, v); }
+for (const [k, v] of Object.entries(arguments[1])) { window.sessionStorage.setItem(k, v); }
+"""
+
+
+def capture_state(driver):
+    """Snapshot of the browser state: cookies, localStorage, sessionStorage and URL"""
+    state = driver.execute_script(CAPTURE_SCRIPT)
+    state["cookies"] = driver.get_cookies()
+    return state
+
+
+def restore_state(driver, state, url=None):
+    """
+    Put a snapshot back into a (fresh or pooled) driver and open its page.
+    Returns False when the site did not accept it (e.g. redirected to login).
+    """
+    #Cookies and storage can only be set for the domain that is currently open
+    driver.get(get_base_url())
+    driver.delete_all_cookies()
+    for cookie in state["cookies"]:
+        driver.add_cookie(cookie)
+    driver.execute_script(RESTORE_STORAGE_SCRIPT, state["local_storage"], state["session_storage"])
+
+    target = url or state["url"]
+    driver.get(target)
+    return driver.current_url.split("?")[0] == target.split("?")[0]
+
+
+def is_expired(state, margin=30):
+    #saucedemo session cookie only lives for a few minutes
+    expiries = [c["expiry"] for c in state["cookies"] if "expiry" in c]
+    return bool(expiries) and min(expiries) - margin < time.time()
+
+
+class StateSnapshotCache:
+    """
+    Named precondition states built once per worker process.
+    First call runs the builder (the real UI steps) and snapshots the result,
+    next calls restore the snapshot in one step instead of replaying the steps.
+    """
+
+    def __init__(self):
+        self._snapshots = {}
+
+    def restore_or_build(self, driver, name, builder, ready=None):
+        """
+        Restore state `name`, or build it with builder() and save it. Returns True if restored.
+        ready() is the ready wait of the restored page (e.g. wait_for_step): driver.get() returns
+        before the page is hydrated with the "eager" load strategy.
+        """
+        state = self._snapshots.get(name)
+        if state and not is_expired(state):
+            if restore_state(driver, state) and self._wait_ready(ready):
+                logger.info("StateSnapshotCache: restored '%s'", name)
+                return True
+            logger.warning("StateSnapshotCache: snapshot '%s' rejected, building it again", name)
+            self.invalidate(name)
+
+        builder()
+        self._snapshots[name] = capture_state(driver)
+        logger.info("StateSnapshotCache: built '%s' (%s)", name, self._snapshots[name]["url"])
+        return False
+
+    @staticmethod
+    def _wait_ready(ready):
+        if ready is None:
+            return True
+        try:
+            ready()
+        except TimeoutException:
+            return False
+        return True
+
+    def invalidate(self, name=None):
+        if name is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(name, None)
+
+
+_state_cache = StateSnapshotCache()
+
+
+def get_state_cache():
+    """Return the precondition snapshot cache of this process"""
+    return _state_cache
@@ -0,0 +1,181 @@
+import os
+import sys
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.log_pipeline import log_event
+
+
+class WaitTelemetry:
+    """Duration of every wait in this process, grouped by the page object method that waited"""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, label, duration, timed_out):
+        self.records.append({"label": label, "duration": duration, "timed_out": timed_out})
+        page, _, action = label.rpartition(".")
+        log_event(action, page or None, duration, "timeout" if timed_out else "ok")
+
+    def clear(self):
+        self.records = []
+
+    def summary(self):
+        """RETURN: {label: {"count", "total", "max", "timeouts"}} sorted by total time"""
+        stats = {}
+        for r in self.records:
+            s = stats.setdefault(r["label"], {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            s["count"] += 1
+            s["total"] += r["duration"]
+            s["max"] = max(s["max"], r["duration"])
+            s["timeouts"] += int(r["timed_out"])
+        return dict(sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True))
+
+
+_telemetry = WaitTelemetry()
+
+
+def get_wait_telemetry():
+    return _telemetry
+
+
+class TimedWait(WebDriverWait):
+    """
+    WebDriverWait that reports how long each until()/until_not() took.
+    The label is the calling method (e.g. sauceDemoCartPage.get_page_title).
+    """
+
+    def __init__(self, driver, timeout, poll_frequency=0.5, ignored_exceptions=None, telemetry=None):
+        super().__init__(driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=ignored_exceptions)
+        self.telemetry = telemetry or _telemetry
+
+    def until(self, method, message=""):
+        return self._timed(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._timed(super().until_not, method, message)
+
+    def _timed(self, wait_function, method, message):
+        label = _caller_label()
+        start = time.perf_counter()
+        try:
+            result = wait_function(method, message)
+        except TimeoutException:
+            self.telemetry.record(label, time.perf_counter() - start, True)
+            raise
+        self.telemetry.record(label, time.perf_counter() - start, False)
+        return result
+
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGES_DIR = os.path.join(os.path.dirname(UTILS_DIR), "pages")
+BASE_PAGE = os.path.join(PAGES_DIR, "base_page.py")
+SELENIUM_DIR = os.sep + "selenium" + os.sep
+
+_frame_kinds = {} #code filename -> "helper" / "base" / "page" / "other"
+
+
+def _frame_kind(frame):
+    code = frame.f_code
+    if code.co_name == "<lambda>":
+        return "helper"
+    kind = _frame_kinds.get(code.co_filename)
+    if kind is None:
+        path = os.path.abspath(code.co_filename)
+        if path.startswith(UTILS_DIR + os.sep) or SELENIUM_DIR in path:
+            kind = "helper"
+        elif path == BASE_PAGE:
+            kind = "base"
+        elif path.startswith(PAGES_DIR + os.sep):
+            kind = "page"
+        else:
+            kind = "other"
+        _frame_kinds[code.co_filename] = kind
+    return kind
+
+
+def _frame_label(frame):
+    owner = frame.f_locals.get("self")
+    if owner is not None:
+        return f"{owner.__class__.__name__}.{frame.f_code.co_name}"
+    return frame.f_code.co_name
+
+
+def _caller_label():
+    """
+    Page object method that waited, e.g. sauceDemoCartPage.get_page_title.
+    Lambdas, utils/ (waits, element cache), selenium and base_page helpers (find_visible,
+    wait_for_cart_badge, ...) are skipped; a base_page method called from a test
+    (open, wait_until_ready) is the label itself.
+    """
+    frame = sys._getframe(2) #0 = _caller_label, 1 = _timed
+    base = None
+    while frame is not None:
+        kind = _frame_kind(frame)
+        if kind == "page":
+            return _frame_label(frame)
+        if kind == "base":
+            base = frame
+        elif kind == "other":
+            return _frame_label(base or frame)
+        frame = frame.f_back
+    return _frame_label(base) if base else "unknown"
+
+
+class DomMutationWatcher:
+    """
+    MutationObserver injected in the page, used to wait for the UI to react to an action
+    without fixed sleeps: arm() BEFORE the action, then wait_for_mutation() after it.
+    wait_for_mutation() is ONE async script call that returns as soon as the DOM changes.
+    """
+
+    ARM_SCRIPT = """
+        var root = document.querySelector(arguments[0]) || document.body;
+        if (window.__qaObserver) { window.__qaObserver.disconnect(); }
+        window.__qaMutations = 0;
+        window.__qaOnMutation = null;
+        window.__qaObserver = new MutationObserver(function (mutations) {
+            window.__qaMutations += mutations.length;
+            if (window.__qaOnMutation) { window.__qaOnMutation(); }
+        });
+        window.__qaObserver.observe(root, {childList: true, subtree: true, characterData: true, attributes: true});
+    """
+
+    WAIT_SCRIPT = """
+        var done = arguments[arguments.length - 1];
+        if (window.__qaMutations === undefined) { done(false); return; }
+        function finish(result) {
+            window.__qaOnMutation = null;
+            window.__qaMutations = 0;
+            done(result);
+        }
+        if (window.__qaMutations > 0) { finish(true); return; }
+        var timer = setTimeout(function () { finish(false); }, arguments[0]);
+        window.__qaOnMutation = function () { clearTimeout(timer); finish(true); };
+    """
+
+    def __init__(self, driver, root_selector="body"):
+        self.driver = driver
+        self.root_selector = root_selector
+
+    def arm(self):
+        self.driver.execute_script(self.ARM_SCRIPT, self.root_selector)
+        return self
+
+    def wait_for_mutation(self, timeout):
+        """RETURN: True when the DOM changed, False on timeout (or page navigated away)"""
+        return self.driver.execute_async_script(self.WAIT_SCRIPT, int(timeout * 1000))
+
+    def wait_until(self, condition, timeout, label="dom_change"):
+        """Re-check `condition` after every DOM mutation until it is true (no polling, no sleeps)"""
+        start = time.perf_counter()
+        deadline = start + timeout
+        while not condition():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not self.wait_for_mutation(remaining):
+                if condition():
+                    break
+                _telemetry.record(label, time.perf_counter() - start, True)
+                raise TimeoutException(f"DOM did not reach expected state in {timeout}s ({label})")
+        _telemetry.record(label, time.perf_counter() - start, False)
+        return True
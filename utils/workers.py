@@ -0,0 +1,21 @@
+import os
+
+# pytest-xdist gives every worker process an id (gw0, gw1, ...)
+# when tests run without -n there is only the "main" process
+MAIN_WORKER = "main"
+
+
+def get_worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER", MAIN_WORKER)
+
+
+def get_worker_count():
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+
+
+def worker_file_name(name, extension):
+    """automation_test + .log -> automation_test_gw0.log (or automation_test.log on main)"""
+    worker_id = get_worker_id()
+    if worker_id == MAIN_WORKER:
+        return f"{name}{extension}"
+    return f"{name}_{worker_id}{extension}"